@@ -25,7 +25,9 @@ Dependency Injection:
     6. Endpoint handler receives the fully configured service
 """
 import logging
-from fastapi import APIRouter, Depends, Query, UploadFile, File, Response, Form
+from fastapi import APIRouter, Depends, Query, UploadFile, File, Form, Response
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, List
 
 from schemas import (
@@ -61,6 +63,20 @@ DEFAULT_QUERY_LIMIT = 100  # Default limit if none specified
 MAX_QUERY_LIMIT = 1000     # Maximum allowed limit
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _load_graph_json(
+    health_service: HealthService,
+    graph_service: GraphService,
+    patient_name: str
+) -> str:
+    """Load a patient's graph records and serialize their figure (blocking)."""
+    records = health_service.get_graph_records(patient=patient_name)
+    return graph_service.generate_graph_json(records, patient_name)
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -166,11 +182,13 @@ async def list_records(
             }
         )
     
-    return health_service.get_records(
+    # Returning a Response skips re-validating every row against
+    # response_model, which is kept for the OpenAPI schema
+    return JSONResponse(health_service.get_records(
         patient=patient,
         record_type=record_type,
         limit=effective_limit
-    )
+    ))
 
 
 @router.get(
@@ -202,15 +220,45 @@ async def get_html_view(
     - 404 Not Found: If patient has no records (returns empty graph)
     """
     # Get records for the patient
-    records = health_service.get_records(patient=patient_name)
+    records = health_service.get_graph_records(patient=patient_name)
     
-    # Generate HTML graph
-    html_content = graph_service.generate_html_graph(records, patient_name)
-    
-    # Return HTML response
+    # Render the whole page in the threadpool before responding, so a
+    # failure while building the figure still returns a 500
+    html_content = await run_in_threadpool(
+        graph_service.generate_html_graph, records, patient_name
+    )
     return Response(content=html_content, media_type="text/html")
 
 
+@router.get(
+    "/graph-data",
+    summary="Get Plotly figure JSON for a patient's health records",
+    description="Return the graph figure (data, layout and config) as JSON, for clients that "
+                "already load plotly.js and render the figure themselves with Plotly.react."
+)
+async def get_graph_data(
+    patient_name: str = Query(..., description="Patient name to generate graph for", example="John Doe"),
+    health_service: HealthService = Depends(get_health_service),
+    graph_service: GraphService = Depends(get_graph_service)
+):
+    """
+    Get the Plotly figure for a patient's health records as JSON.
+    
+    Query Parameters:
+    - **patient_name**: Patient name to generate graph for (required)
+    
+    Returns a JSON object with `data`, `layout` and `config`, matching the
+    arguments of `Plotly.react`. The html-view endpoint remains the
+    self-contained page used by the Telegram bot.
+    """
+    # Loading the records and building the figure both block, so they run
+    # together in the threadpool instead of on the event loop
+    graph_json = await run_in_threadpool(
+        _load_graph_json, health_service, graph_service, patient_name
+    )
+    return Response(content=graph_json, media_type="application/json")
+
+
 @router.post(
     "/upload",
     response_model=ImageUploadResponse,
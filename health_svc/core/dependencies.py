@@ -84,6 +84,8 @@ def reset_database() -> None:
     This allows tests to inject a fresh database instance.
     """
     global _database_instance
+    if _database_instance is not None:
+        _database_instance.close()
     _database_instance = None
 
 
@@ -161,11 +163,13 @@ def get_health_service() -> "HealthService":
     )
 
 
+@lru_cache(maxsize=1)
 def get_graph_service() -> "GraphService":
     """
-    Get a GraphService instance.
+    Get the shared GraphService instance.
     
-    GraphService is stateless and doesn't require repository injection.
+    GraphService is stateless and doesn't require repository injection,
+    so a single instance is created and reused across requests.
     
     Returns:
         GraphService: Service for generating health record graphs.
@@ -175,11 +179,14 @@ def get_graph_service() -> "GraphService":
     return GraphService()
 
 
+@lru_cache(maxsize=1)
 def get_upload_service() -> "UploadService":
     """
-    Get an UploadService instance.
+    Get the shared UploadService instance.
     
-    UploadService handles file uploads and is configured via settings.
+    UploadService handles file uploads and is configured via settings. It
+    holds no per-request state, so a single instance is reused and the
+    upload directory is created once rather than on every request.
     
     Returns:
         UploadService: Service for file upload operations.
@@ -31,20 +31,51 @@ import logging
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional, List
+from typing import Dict, Any, Tuple, Optional, List, Union
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Leading numeric portion of a value string (handles "5.6 mg/dl" or ">100")
+_NUMERIC_PREFIX_RE = re.compile(r'^[<>]?\s*(\d+\.?\d*)')
+
+# Whitespace runs in metric names (see _normalize_metric_name)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class _NameCharTable(dict):
+    """
+    str.translate table keeping [a-z0-9] and whitespace, deleting everything else.
+    
+    Entries are filled lazily on first sight of a code point, so the table
+    stays small while still covering all of Unicode.
+    """
+    __slots__ = ()
+
+    def __missing__(self, code: int) -> Optional[int]:
+        ch = chr(code)
+        kept = code if ('a' <= ch <= 'z' or '0' <= ch <= '9' or ch.isspace()) else None
+        self[code] = kept
+        return kept
+
+
+_NAME_CHAR_TABLE = _NameCharTable()
+
 
 # =============================================================================
 # METRIC DEFINITION DATACLASS
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricDefinition:
     """
     Immutable definition for a health metric.
@@ -59,6 +90,8 @@ class MetricDefinition:
         category: Grouping category (kidney, sugar, electrolyte, blood, liver, lipid, other)
         description: Educational tooltip text
         aliases: Alternative names that resolve to this metric
+        normalized_canonical: canonical_name as normalized for lookup (derived)
+        normalized_aliases: aliases as normalized for lookup (derived)
     """
     canonical_name: str
     display_name: str
@@ -69,6 +102,14 @@ class MetricDefinition:
     category: str
     description: str
     aliases: Tuple[str, ...]
+    normalized_canonical: str = field(init=False, repr=False, compare=False)
+    normalized_aliases: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Names are fixed once loaded, so normalize them here rather than on
+        # every lookup-map build
+        object.__setattr__(self, 'normalized_canonical', _normalize_metric_name(self.canonical_name))
+        object.__setattr__(self, 'normalized_aliases', tuple(_normalize_metric_name(a) for a in self.aliases))
 
     def is_abnormal(self, value: float) -> bool:
         """
@@ -110,7 +151,7 @@ def _load_yaml_config() -> Dict[str, Any]:
     config_path = _get_config_path()
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_SafeLoader)
     except FileNotFoundError:
         logger.error("Metrics config file not found", extra={'path': str(config_path)})
         raise
@@ -243,13 +284,14 @@ def _normalize_metric_name(name: str) -> str:
     """
     if not name:
         return ''
-    # Lowercase and strip
-    normalized = name.lower().strip()
-    # Remove non-alphanumeric except spaces
-    normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
+    # Lowercase, strip, then drop non-alphanumerics in one C-level pass
+    normalized = name.lower().strip().translate(_NAME_CHAR_TABLE)
+    # Removing edge punctuation can leave a leading/trailing space, which
+    # lookups have always preserved; split/join would strip it
+    if normalized[:1].isspace() or normalized[-1:].isspace():
+        return _WHITESPACE_RE.sub(' ', normalized)
     # Collapse multiple spaces
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+    return ' '.join(normalized.split())
 
 
 @lru_cache(maxsize=1)
@@ -263,7 +305,7 @@ def _build_metric_lookup() -> Dict[str, MetricDefinition]:
     lookup: Dict[str, MetricDefinition] = {}
     for metric in metric_definitions:
         # Register canonical name
-        canonical_normalized = _normalize_metric_name(metric.canonical_name)
+        canonical_normalized = metric.normalized_canonical
         if canonical_normalized in lookup:
             logger.warning(
                 "Duplicate metric key detected",
@@ -272,8 +314,7 @@ def _build_metric_lookup() -> Dict[str, MetricDefinition]:
         lookup[canonical_normalized] = metric
         
         # Register all aliases
-        for alias in metric.aliases:
-            alias_normalized = _normalize_metric_name(alias)
+        for alias_normalized in metric.normalized_aliases:
             if alias_normalized and alias_normalized not in lookup:
                 lookup[alias_normalized] = metric
             elif alias_normalized in lookup and lookup[alias_normalized] != metric:
@@ -355,6 +396,7 @@ def get_metric(metric_name: str) -> MetricDefinition:
     return lookup[normalized]
 
 
+@lru_cache(maxsize=128)
 def get_metric_config(metric_name: str) -> MetricDefinition:
     """
     Get metric definition by name with fallback to default.
@@ -362,6 +404,10 @@ def get_metric_config(metric_name: str) -> MetricDefinition:
     This is a backward-compatible version that returns DEFAULT_METRIC_CONFIG
     for unknown metrics instead of raising an error.
     
+    Results are cached per raw name: record types repeat across records and
+    the graph pipeline resolves the same names several times per request,
+    so normalization runs once per distinct name.
+    
     Args:
         metric_name: The metric name to look up (case-insensitive)
     
@@ -373,7 +419,8 @@ def get_metric_config(metric_name: str) -> MetricDefinition:
     
     config = lookup.get(normalized)
     if config is None:
-        logger.debug("Unknown metric, using default config", extra={'metric': metric_name, 'normalized': normalized})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unknown metric, using default config", extra={'metric': metric_name, 'normalized': normalized})
         return DEFAULT_METRIC_CONFIG
     return config
 
@@ -445,45 +492,49 @@ def parse_metric_value(value_str: str, metric_name: str = '') -> Optional[float]
     if value_str is None:
         return None
     
+    # Fast path: plain numbers (the vast majority of stored values).
+    # float() ignores surrounding whitespace, so no strip/copy is needed.
+    try:
+        return float(value_str)
+    except (TypeError, ValueError):
+        pass
+    
     cleaned = str(value_str).strip()
     if not cleaned:
         return None
     
     # Reject composite values explicitly (e.g., blood pressure "120/80")
     if '/' in cleaned:
-        logger.warning(
-            "Composite value cannot be parsed as single metric",
-            extra={'value': value_str, 'metric': metric_name, 'hint': 'Split into separate metrics'}
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Composite value cannot be parsed as single metric",
+                extra={'value': value_str, 'metric': metric_name, 'hint': 'Split into separate metrics'}
+            )
         return None
     
-    # Try direct float conversion first (most common case)
-    try:
-        return float(cleaned)
-    except ValueError:
-        pass
-    
     # Extract numeric portion (handles cases like "5.6 mg/dl" or ">100")
-    match = re.match(r'^[<>]?\s*(\d+\.?\d*)', cleaned)
+    match = _NUMERIC_PREFIX_RE.match(cleaned)
     if match:
         try:
             return float(match.group(1))
         except ValueError:
             pass
     
-    logger.warning(
-        "Could not parse metric value",
-        extra={'value': value_str, 'metric': metric_name}
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Could not parse metric value",
+            extra={'value': value_str, 'metric': metric_name}
+        )
     return None
 
 
-def parse_timestamp(ts: str, record_id: Any = None) -> Optional[datetime]:
+def parse_timestamp(ts: Union[str, datetime], record_id: Any = None) -> Optional[datetime]:
     """
     Safely parse an ISO timestamp string to datetime.
     
     Args:
-        ts: ISO format timestamp string (e.g., "2025-01-15T10:30:00")
+        ts: ISO format timestamp string (e.g., "2025-01-15T10:30:00"),
+            or an already-parsed datetime, which is returned as is
         record_id: Optional identifier for logging context
     
     Returns:
@@ -494,24 +545,39 @@ def parse_timestamp(ts: str, record_id: Any = None) -> Optional[datetime]:
     if ts is None:
         return None
     
+    if isinstance(ts, datetime):
+        return ts
+    
     if not isinstance(ts, str):
-        logger.warning(
-            "Timestamp is not a string",
-            extra={'record_id': record_id, 'type': type(ts).__name__}
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Timestamp is not a string",
+                extra={'record_id': record_id, 'type': type(ts).__name__}
+            )
         return None
     
     ts_stripped = ts.strip()
     if not ts_stripped:
         return None
     
+    # Every ISO 8601 date starts with a year digit; reject anything else up
+    # front instead of raising and catching inside the parser
+    if ts_stripped[0] not in '0123456789':
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Invalid timestamp format",
+                extra={'record_id': record_id, 'timestamp': ts, 'error': 'does not start with a year'}
+            )
+        return None
+    
     try:
         return datetime.fromisoformat(ts_stripped)
     except ValueError as e:
-        logger.warning(
-            "Invalid timestamp format",
-            extra={'record_id': record_id, 'timestamp': ts, 'error': str(e)}
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Invalid timestamp format",
+                extra={'record_id': record_id, 'timestamp': ts, 'error': str(e)}
+            )
         return None
 
 
@@ -9,8 +9,9 @@ Use core.dependencies.get_database() instead of instantiating directly.
 This ensures proper lifecycle management and testability.
 """
 import sqlite3
+import threading
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from core.config import DATABASE_PATH, DATABASE_BUSY_TIMEOUT
@@ -27,6 +28,7 @@ class Database:
     - WAL mode for better concurrent read/write performance
     - Busy timeout to handle lock contention gracefully
     - Foreign key constraints enabled by default
+    - One reused connection per thread instead of one per query
     - UTC timestamps for all database operations
     
     Usage:
@@ -49,6 +51,25 @@ class Database:
         self.db_path = db_path or DATABASE_PATH
         self.busy_timeout = busy_timeout if busy_timeout is not None else DATABASE_BUSY_TIMEOUT
         
+        # Patient name -> row (id, name, created_at) lookups shared by all
+        # repositories on this database. Patients are never renamed or
+        # deleted, so entries never go stale.
+        self.patient_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Full patient list (PatientRepository.get_all), dropped whenever a
+        # patient is added. The version counter lets a reader that raced
+        # with an insert avoid storing the pre-insert list.
+        self.patient_list_cache: Optional[List[Dict[str, Any]]] = None
+        self.patient_list_version = 0
+        self.patient_list_lock = threading.Lock()
+        
+        # Each thread keeps one open connection (see get_connection()),
+        # tracked by thread so close() can release them and connections
+        # left behind by finished threads can be closed
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        
         # Ensure database directory exists
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
@@ -67,6 +88,12 @@ class Database:
         conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = ON")
+        # WAL is consistent with NORMAL sync; only fsync at checkpoints
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # Keep sort/temp tables off disk and read pages through a shared
+        # memory map rather than copying them into each connection's cache
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
     
     def _init_db(self) -> None:
         """Initialize database schema and enable WAL mode if not already enabled."""
@@ -109,6 +136,19 @@ class Database:
             )
         """)
         
+        # Record queries order by timestamp, optionally filtered by patient.
+        # These indexes let both forms walk an index in timestamp order
+        # instead of scanning the table and sorting. record_type is matched
+        # with a leading-wildcard LIKE, which no index can serve.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_health_records_patient_timestamp
+            ON health_records (patient_id, timestamp)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_health_records_timestamp
+            ON health_records (timestamp)
+        """)
+        
         conn.commit()
         conn.close()
         
@@ -119,15 +159,44 @@ class Database:
     
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get a new database connection with concurrency settings.
+        Get the calling thread's database connection.
+        
+        The connection is opened and configured on first use in each thread
+        and reused afterwards, so queries skip the open/PRAGMA setup.
+        Opening one also closes connections whose threads have exited, so
+        the set stays bounded by the number of live threads.
+        Callers must not close it; they commit or roll back their own
+        writes (e.g. ``with conn:``) so no transaction is left open.
         
         Returns:
-            sqlite3.Connection: A new database connection configured for
-                concurrent access with foreign keys enabled and busy timeout set.
+            sqlite3.Connection: A connection configured for concurrent
+                access with foreign keys enabled and busy timeout set.
         """
-        conn = sqlite3.connect(self.db_path)
-        self._configure_connection(conn)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from any thread;
+            # each connection is otherwise used by the thread that opened it
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._configure_connection(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                stale = [
+                    self._connections.pop(thread)
+                    for thread in list(self._connections)
+                    if not thread.is_alive()
+                ]
+                self._connections[threading.current_thread()] = conn
+            for old_conn in stale:
+                old_conn.close()
         return conn
+    
+    def close(self) -> None:
+        """Close every connection opened by get_connection()."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            conn.close()
+        self._local = threading.local()
 
 
 # =============================================================================
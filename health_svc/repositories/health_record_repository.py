@@ -20,6 +20,14 @@ from core.datetime_utils import format_iso, parse_datetime
 
 logger = logging.getLogger(__name__)
 
+# Shared by save() and save_batch(): sqlite3 caches compiled statements per
+# connection keyed by SQL text, so both hit the same cache entry
+_INSERT_RECORD_SQL = """
+    INSERT INTO health_records
+    (timestamp, patient_id, record_type, value, unit, lab_name)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 class HealthRecordRepository:
     """
@@ -47,12 +55,12 @@ class HealthRecordRepository:
         value: str,
         unit: Optional[str] = None,
         lab_name: Optional[str] = "self"
-    ) -> Tuple[int, Dict[str, Any]]:
+    ) -> int:
         """
-        Save a health record to the database and return the complete record.
+        Save a health record to the database.
         
-        Uses a single transaction to insert and retrieve the record,
-        avoiding race conditions that could occur if we queried separately.
+        The caller already holds every stored field, so the inserted row is
+        not read back; only the generated ID is returned.
         
         Args:
             timestamp: When the record was created.
@@ -63,21 +71,17 @@ class HealthRecordRepository:
             lab_name: Name of the lab (optional, defaults to "self").
         
         Returns:
-            Tuple[int, Dict[str, Any]]: A tuple of (record_id, record_dict) where
-                record_dict contains the complete record with patient name resolved.
+            int: ID of the inserted record.
         """
         conn = self._db.get_connection()
         cursor = conn.cursor()
         
-        try:
-            # Format timestamp as ISO 8601 UTC string for storage
-            timestamp_str = format_iso(timestamp)
-            
-            cursor.execute("""
-                INSERT INTO health_records 
-                (timestamp, patient_id, record_type, value, unit, lab_name)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+        # Format timestamp as ISO 8601 UTC string for storage
+        timestamp_str = format_iso(timestamp)
+        
+        # Commits on success, rolls back on error
+        with conn:
+            cursor.execute(_INSERT_RECORD_SQL, (
                 timestamp_str,
                 patient_id,
                 record_type,
@@ -85,35 +89,8 @@ class HealthRecordRepository:
                 unit,
                 lab_name
             ))
-            
-            record_id = cursor.lastrowid
-            
-            # Fetch the complete record with patient name within the same transaction
-            cursor.execute("""
-                SELECT hr.id, hr.timestamp, p.name, hr.record_type, hr.value, 
-                       hr.unit, hr.lab_name, hr.created_at
-                FROM health_records hr
-                INNER JOIN patients p ON hr.patient_id = p.id
-                WHERE hr.id = ?
-            """, (record_id,))
-            row = cursor.fetchone()
-            
-            conn.commit()
-            
-            record_dict = {
-                "id": row[0],
-                "timestamp": row[1],
-                "patient": row[2],
-                "record_type": row[3],
-                "value": row[4],
-                "unit": row[5],
-                "lab_name": row[6] if row[6] is not None else "self",
-                "created_at": row[7]
-            }
-            
-            return record_id, record_dict
-        finally:
-            conn.close()
+        
+        return cursor.lastrowid
     
     def get_all(
         self,
@@ -132,9 +109,77 @@ class HealthRecordRepository:
         Returns:
             List of HealthRecord objects with patient name resolved from foreign key.
         """
+        rows = self._select(patient_name, record_type, limit)
+        
+        records = []
+        for row in rows:
+            # Parse timestamp using our UTC-aware utility
+            timestamp = parse_datetime(row[0])
+            records.append(HealthRecord(
+                timestamp=timestamp,
+                patient=row[1],  # Patient name from JOIN
+                record_type=row[2],
+                value=row[3],
+                unit=row[4],
+                lab_name=row[5] if row[5] is not None else "self"
+            ))
+        
+        return records
+    
+    def get_all_rows(
+        self,
+        patient_name: Optional[str] = None,
+        record_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, str, str, str, Optional[str], str]]:
+        """
+        Retrieve health records as plain tuples ready for API responses.
+        
+        Same filtering and ordering as get_all(), but skips building
+        HealthRecord objects. Timestamps are returned as ISO 8601 UTC strings
+        (format_iso output); rows stored by save() already hold exactly that
+        string and are passed through without a parse/format round trip.
+        
+        Returns:
+            List of (timestamp, patient, record_type, value, unit, lab_name) tuples.
+        """
+        rows = self._select(patient_name, record_type, limit)
+        
+        result = []
+        for timestamp, patient, rec_type, value, unit, lab_name in rows:
+            # Canonical "YYYY-MM-DDTHH:MM:SSZ"; anything else is normalized
+            if not (len(timestamp) == 20 and timestamp[10] == 'T' and timestamp[19] == 'Z'):
+                timestamp = format_iso(parse_datetime(timestamp))
+            result.append((
+                timestamp,
+                patient,
+                rec_type,
+                value,
+                unit,
+                lab_name if lab_name is not None else "self"
+            ))
+        
+        return result
+    
+    def _select(
+        self,
+        patient_name: Optional[str],
+        record_type: Optional[str],
+        limit: Optional[int]
+    ) -> List[Tuple[Any, ...]]:
+        """Run the filtered record query shared by get_all() and get_all_rows()."""
         conn = self._db.get_connection()
         cursor = conn.cursor()
-        
+        cursor.execute(*self._build_select(patient_name, record_type, limit))
+        return cursor.fetchall()
+    
+    def _build_select(
+        self,
+        patient_name: Optional[str],
+        record_type: Optional[str],
+        limit: Optional[int]
+    ) -> Tuple[str, List[Any]]:
+        """Build the SQL and parameters run by _select()."""
         # Use JOIN to get patient name from patients table
         query = """
             SELECT hr.timestamp, p.name, hr.record_type, hr.value, hr.unit, hr.lab_name 
@@ -142,7 +187,7 @@ class HealthRecordRepository:
             INNER JOIN patients p ON hr.patient_id = p.id
             WHERE 1=1
         """
-        params = []
+        params: List[Any] = []
         
         if patient_name:
             query += " AND p.name = ?"
@@ -158,24 +203,7 @@ class HealthRecordRepository:
             query += " LIMIT ?"
             params.append(limit)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        records = []
-        for row in rows:
-            # Parse timestamp using our UTC-aware utility
-            timestamp = parse_datetime(row[0])
-            records.append(HealthRecord(
-                timestamp=timestamp,
-                patient=row[1],  # Patient name from JOIN
-                record_type=row[2],
-                value=row[3],
-                unit=row[4],
-                lab_name=row[5] if row[5] is not None else "self"
-            ))
-        
-        return records
+        return query, params
     
     def save_batch(
         self,
@@ -209,25 +237,29 @@ class HealthRecordRepository:
             # Start transaction
             cursor.execute("BEGIN TRANSACTION")
             
-            # Prepare all records for batch insert
-            record_ids = []
             # Format timestamp as ISO 8601 UTC string for storage
             timestamp_str = format_iso(timestamp)
             
-            for test_result in test_results:
-                cursor.execute("""
-                    INSERT INTO health_records 
-                    (timestamp, patient_id, record_type, value, unit, lab_name)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            # Prepare all records for batch insert
+            rows = [
+                (
                     timestamp_str,
                     patient_id,
                     test_result["test_name"],
                     test_result["results"],
                     test_result.get("unit"),
                     lab_name
-                ))
-                record_ids.append(cursor.lastrowid)
+                )
+                for test_result in test_results
+            ]
+            cursor.executemany(_INSERT_RECORD_SQL, rows)
+            
+            # executemany() leaves lastrowid unset. This transaction holds the
+            # write lock, so the batch got consecutive IDs ending at the last one
+            record_ids = []
+            if rows:
+                last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                record_ids = list(range(last_id - len(rows) + 1, last_id + 1))
             
             # Commit transaction (all or nothing)
             conn.commit()
@@ -244,6 +276,4 @@ class HealthRecordRepository:
                 f"Error saving health records: {str(e)}. Transaction rolled back."
             )
             raise
-        finally:
-            conn.close()
 
@@ -40,7 +40,7 @@ class PatientRepository:
         """
         Add a new patient to the database and return the created record.
         
-        Uses a single transaction to insert and retrieve the record,
+        The insert returns the created row directly (INSERT ... RETURNING),
         avoiding race conditions that could occur if we queried separately.
         
         Args:
@@ -54,44 +54,97 @@ class PatientRepository:
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                INSERT INTO patients (name)
-                VALUES (?)
-            """, (name,))
-            
-            # Get the inserted row using lastrowid within the same transaction
-            # This is safe because we're in the same connection/transaction
-            patient_id = cursor.lastrowid
-            
-            # Fetch the complete record to get the created_at timestamp
-            cursor.execute(
-                "SELECT id, name, created_at FROM patients WHERE id = ?",
-                (patient_id,)
-            )
-            row = cursor.fetchone()
-            
-            conn.commit()
-            
-            if row:
-                return {
-                    "id": row[0],
-                    "name": row[1],
-                    "created_at": row[2]
-                }
-            return None
+            # Commits on success, rolls back on error
+            with conn:
+                # RETURNING (SQLite 3.35+) hands back the created row, including
+                # the defaulted created_at, without a follow-up SELECT
+                cursor.execute("""
+                    INSERT INTO patients (name)
+                    VALUES (?)
+                    RETURNING id, name, created_at
+                """, (name,))
+                row = cursor.fetchone()
         except sqlite3.IntegrityError:
             # Patient name already exists (UNIQUE constraint)
             return None
-        finally:
-            conn.close()
+        
+        if row:
+            patient = {
+                "id": row[0],
+                "name": row[1],
+                "created_at": row[2]
+            }
+            self._db.patient_cache[row[1]] = patient
+            with self._db.patient_list_lock:
+                self._db.patient_list_version += 1
+                self._db.patient_list_cache = None
+            return dict(patient)
+        return None
+    
+    def add_many(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Add several patients in a single transaction.
+        
+        Names that already exist (or repeat within names) are skipped
+        rather than failing the batch. The patient list cache is
+        invalidated once for the whole batch.
+        
+        Args:
+            names: Full names of the patients to add.
+        
+        Returns:
+            List[Dict[str, Any]]: The created patient dicts (id, name, created_at),
+                in input order, excluding skipped names.
+        """
+        if not names:
+            return []
+        
+        conn = self._db.get_connection()
+        cursor = conn.cursor()
+        
+        # executemany() cannot fetch RETURNING rows, so run the inserts
+        # one by one in a single transaction (committed once by `with conn`)
+        created = []
+        with conn:
+            for name in names:
+                cursor.execute("""
+                    INSERT INTO patients (name)
+                    VALUES (?)
+                    ON CONFLICT (name) DO NOTHING
+                    RETURNING id, name, created_at
+                """, (name,))
+                row = cursor.fetchone()
+                if row:
+                    created.append({
+                        "id": row[0],
+                        "name": row[1],
+                        "created_at": row[2]
+                    })
+        
+        if created:
+            for patient in created:
+                self._db.patient_cache[patient["name"]] = patient
+            with self._db.patient_list_lock:
+                self._db.patient_list_version += 1
+                self._db.patient_list_cache = None
+        return [dict(p) for p in created]
     
     def get_all(self) -> List[Dict[str, Any]]:
         """
         Get all patients from the database, sorted alphabetically.
         
+        The list is cached on the Database until the next add(), so
+        repeated /patients requests skip the query.
+        
         Returns:
             List[dict]: List of patient dictionaries with id, name, and created_at.
         """
+        cached = self._db.patient_list_cache
+        if cached is not None:
+            return [dict(p) for p in cached]
+        
+        version = self._db.patient_list_version
+        
         conn = self._db.get_connection()
         cursor = conn.cursor()
         
@@ -101,9 +154,8 @@ class PatientRepository:
         """)
         
         rows = cursor.fetchall()
-        conn.close()
         
-        return [
+        patients = [
             {
                 "id": row[0],
                 "name": row[1],
@@ -111,48 +163,60 @@ class PatientRepository:
             }
             for row in rows
         ]
+        
+        with self._db.patient_list_lock:
+            # Skip storing if a patient was added while we were querying
+            if self._db.patient_list_version == version:
+                self._db.patient_list_cache = patients
+        
+        return [dict(p) for p in patients]
     
     def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get a patient by name.
         
+        Found patients are cached on the Database, so repeated lookups of
+        the same name (e.g. every record saved in a conversation) skip the
+        query. Misses are not cached, so a patient added by another process
+        is found on the next lookup.
+        
         Args:
             name: The patient's name.
         
         Returns:
             Optional[dict]: Patient dictionary or None if not found.
         """
+        patient = self._db.patient_cache.get(name)
+        if patient is not None:
+            return dict(patient)
+        
         conn = self._db.get_connection()
         cursor = conn.cursor()
         
         cursor.execute("SELECT id, name, created_at FROM patients WHERE name = ?", (name,))
         row = cursor.fetchone()
-        conn.close()
         
-        if row:
-            return {
-                "id": row[0],
-                "name": row[1],
-                "created_at": row[2]
-            }
-        return None
+        if row is None:
+            return None
+        patient = {
+            "id": row[0],
+            "name": row[1],
+            "created_at": row[2]
+        }
+        self._db.patient_cache[name] = patient
+        return dict(patient)
     
     def get_id_by_name(self, name: str) -> Optional[int]:
         """
         Get a patient's ID by their name.
         
+        Served from the same Database cache as get_by_name().
+        
         Args:
             name: The patient's name.
         
         Returns:
             Optional[int]: Patient ID or None if not found.
         """
-        conn = self._db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT id FROM patients WHERE name = ?", (name,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        return result[0] if result else None
-
+        patient = self.get_by_name(name)
+        return patient["id"] if patient is not None else None
@@ -37,6 +37,8 @@ class PatientResponse(BaseModel):
     
     class Config:
         from_attributes = True
+        # Instances are memoized and shared by PatientService
+        frozen = True
         json_schema_extra = {
             "example": {
                 "id": 1,
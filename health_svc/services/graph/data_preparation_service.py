@@ -12,11 +12,11 @@ that can be consumed by any visualization backend.
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from datetime import datetime
-from collections import defaultdict
 from dataclasses import dataclass, field
 
+from models import HealthRecord
 from schemas import HealthRecordResponse
 from core.metric_registry import (
     MetricConfig,
@@ -30,6 +30,78 @@ from core.metric_registry import (
 
 logger = logging.getLogger(__name__)
 
+# Records accepted by the graph pipeline: API responses (ISO string
+# timestamps) or HealthRecord domain objects (datetime timestamps)
+GraphRecord = Union[HealthRecordResponse, HealthRecord]
+
+# Clinical priority order for the summary panel (canonical name -> rank)
+_SUMMARY_PRIORITY: Dict[str, int] = {
+    name: rank for rank, name in enumerate((
+        'creatinine', 'blood urea', 'random blood sugar',
+        'haemoglobin', 'sodium', 'potassium',
+    ))
+}
+
+# Maximum points per metric series handed to a visualization backend.
+# Longer series are downsampled with LTTB to bound payload and render cost.
+MAX_POINTS_PER_METRIC = 500
+
+
+# =============================================================================
+# DOWNSAMPLING
+# =============================================================================
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Select indices of a series using Largest-Triangle-Three-Buckets.
+    
+    LTTB keeps the first and last points and, for each bucket in between,
+    the point forming the largest triangle with the previously selected
+    point and the average of the next bucket. This preserves the visual
+    shape (peaks and troughs) of a line with a fixed number of points.
+    
+    Args:
+        xs: Monotonically increasing x values (e.g. POSIX timestamps)
+        ys: Y values, same length as xs
+        threshold: Maximum number of points to keep
+        
+    Returns:
+        Sorted list of selected indices (all indices if no downsampling needed)
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    
+    bucket_size = (n - 2) / (threshold - 2)
+    indices = [0]
+    a = 0
+    
+    for i in range(threshold - 2):
+        # Average point of the next bucket
+        avg_start = int((i + 1) * bucket_size) + 1
+        avg_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_len = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_len
+        avg_y = sum(ys[avg_start:avg_end]) / avg_len
+        
+        # Pick the point in the current bucket with the largest triangle area
+        ax, ay = xs[a], ys[a]
+        range_start = int(i * bucket_size) + 1
+        range_end = int((i + 1) * bucket_size) + 1
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+        
+        indices.append(next_a)
+        a = next_a
+    
+    indices.append(n - 1)
+    return indices
+
 
 # =============================================================================
 # NORMALIZED DATA STRUCTURES
@@ -73,6 +145,19 @@ class PreparedMetricData:
     def is_empty(self) -> bool:
         """Check if there are no valid data points."""
         return len(self.data_points) == 0
+    
+    def downsampled(self, max_points: int = MAX_POINTS_PER_METRIC) -> List[MetricDataPoint]:
+        """
+        Return data points reduced to at most max_points using LTTB.
+        
+        Series at or below the limit are returned unchanged, so small
+        datasets render exactly.
+        """
+        if len(self.data_points) <= max_points:
+            return self.data_points
+        xs = [dp.timestamp.timestamp() for dp in self.data_points]
+        indices = lttb_indices(xs, self.values, max_points)
+        return [self.data_points[i] for i in indices]
 
 
 @dataclass
@@ -111,6 +196,19 @@ class PreparedBloodPressureData:
     def is_empty(self) -> bool:
         """Check if there are no valid data points."""
         return len(self.data_points) == 0
+    
+    def downsampled(self, max_points: int = MAX_POINTS_PER_METRIC) -> List[BloodPressureDataPoint]:
+        """
+        Return readings reduced to at most max_points using LTTB.
+        
+        Buckets are selected on systolic values so that hypertensive peaks
+        survive; each kept reading retains its paired diastolic value.
+        """
+        if len(self.data_points) <= max_points:
+            return self.data_points
+        xs = [dp.timestamp.timestamp() for dp in self.data_points]
+        indices = lttb_indices(xs, self.systolic_values, max_points)
+        return [self.data_points[i] for i in indices]
 
 
 @dataclass
@@ -163,9 +261,11 @@ class DataPreparationService:
     consumed by any visualization backend (Plotly, matplotlib, etc.).
     """
 
+    __slots__ = ()
+
     def prepare_dataset(
         self,
-        records: List[HealthRecordResponse],
+        records: List[GraphRecord],
     ) -> PreparedDataset:
         """
         Prepare a complete dataset from health records.
@@ -186,11 +286,18 @@ class DataPreparationService:
                 date_range=(now, now),
             )
 
+        # Parse every timestamp exactly once and reuse it in all passes
+        parsed_timestamps = self._parse_timestamps(records)
+        
+        # One chronological sort up front; grouping preserves the order, so
+        # every metric's records arrive already sorted
+        records = self._sort_chronologically(records, parsed_timestamps)
+        
         # Group records by metric type
         records_by_type = self._group_records_by_type(records)
         
         # Prepare blood pressure data (if both systolic and diastolic exist)
-        blood_pressure = self._prepare_blood_pressure(records_by_type)
+        blood_pressure = self._prepare_blood_pressure(records_by_type, parsed_timestamps)
         
         # Remove BP components from standard metrics if BP was prepared
         if blood_pressure and not blood_pressure.is_empty():
@@ -200,7 +307,7 @@ class DataPreparationService:
         # Prepare all other metrics
         prepared_metrics: Dict[str, PreparedMetricData] = {}
         for metric_name, type_records in records_by_type.items():
-            prepared = self._prepare_metric_data(metric_name, type_records)
+            prepared = self._prepare_metric_data(metric_name, type_records, parsed_timestamps)
             if not prepared.is_empty():
                 prepared_metrics[metric_name] = prepared
         
@@ -222,66 +329,140 @@ class DataPreparationService:
             date_range=date_range,
         )
 
+    def _parse_timestamps(
+        self,
+        records: List[GraphRecord],
+    ) -> Dict[int, datetime]:
+        """
+        Parse record timestamps once, keyed by ``id(record)``.
+        
+        Records with missing or invalid timestamps are omitted from the map.
+        Lab reports store many metrics under one timestamp, so each distinct
+        timestamp string is parsed only once.
+        """
+        parsed: Dict[int, datetime] = {}
+        by_text: Dict[str, Optional[datetime]] = {}
+        for record in records:
+            text = record.timestamp
+            if text in by_text:
+                ts = by_text[text]
+            else:
+                ts = parse_timestamp(text, record_id=getattr(record, 'id', None))
+                by_text[text] = ts
+            if ts is not None:
+                parsed[id(record)] = ts
+        return parsed
+
+    def _sort_chronologically(
+        self,
+        records: List[GraphRecord],
+        parsed_timestamps: Dict[int, datetime],
+    ) -> List[GraphRecord]:
+        """
+        Return records with valid timestamps in chronological order.
+        
+        The sort is stable, so records sharing a timestamp keep their
+        original relative order.
+        """
+        dated = [record for record in records if id(record) in parsed_timestamps]
+        dated.sort(key=lambda record: parsed_timestamps[id(record)])
+        return dated
+
     def _group_records_by_type(
         self,
-        records: List[HealthRecordResponse],
-    ) -> Dict[str, List[HealthRecordResponse]]:
-        """Group records by their normalized metric type."""
-        records_by_type: Dict[str, List[HealthRecordResponse]] = defaultdict(list)
+        records: List[GraphRecord],
+    ) -> Dict[str, List[GraphRecord]]:
+        """
+        Group records by their normalized metric type.
+        
+        Record types repeat across many records, so each distinct raw type
+        is lowercased once and mapped straight to its group list.
+        """
+        records_by_type: Dict[str, List[GraphRecord]] = {}
+        group_by_raw_type: Dict[str, List[GraphRecord]] = {}
         for record in records:
-            normalized_type = record.record_type.lower()
-            records_by_type[normalized_type].append(record)
-        return dict(records_by_type)
+            group = group_by_raw_type.get(record.record_type)
+            if group is None:
+                group = records_by_type.setdefault(record.record_type.lower(), [])
+                group_by_raw_type[record.record_type] = group
+            group.append(record)
+        return records_by_type
 
     def _prepare_metric_data(
         self,
         metric_name: str,
-        records: List[HealthRecordResponse],
+        records: List[GraphRecord],
+        parsed_timestamps: Optional[Dict[int, datetime]] = None,
     ) -> PreparedMetricData:
         """
         Prepare data for a single metric type.
         
         Filters out records with unparseable timestamps or values.
-        """
-        sorted_records = sorted(records, key=lambda x: x.timestamp)
-        config = get_metric_config(metric_name)
+        Data points are ordered chronologically by parsed timestamp.
         
-        # Determine unit from first record or fallback to config
-        unit = ''
-        if sorted_records and sorted_records[0].unit:
-            unit = sorted_records[0].unit
-        else:
-            unit = config.unit
-        
-        data_points: List[MetricDataPoint] = []
+        Args:
+            metric_name: Normalized metric name
+            records: Records of this metric type; when parsed_timestamps is
+                     given they must be dated and in chronological order
+            parsed_timestamps: Optional pre-parsed timestamps from
+                               _parse_timestamps; parsed and sorted here if omitted
+        """
+        if parsed_timestamps is None:
+            parsed_timestamps = self._parse_timestamps(records)
+            records = self._sort_chronologically(records, parsed_timestamps)
         
-        for record in sorted_records:
-            ts = parse_timestamp(record.timestamp, record_id=getattr(record, 'id', None))
+        config = get_metric_config(metric_name)
+
+        # Resolve the normal range once instead of per data point; a missing
+        # range uses infinite bounds so nothing is flagged abnormal.
+        low, high = config.range if config.range is not None else (float('-inf'), float('inf'))
+
+        # Single pass: look up the timestamp, parse the value and build the
+        # data point directly into a preallocated list; the unused tail is
+        # trimmed once after the loop.
+        data_points: List[MetricDataPoint] = [None] * len(records)  # type: ignore[list-item]
+        count = 0
+        # Lab values repeat heavily within a metric, so each distinct value
+        # string is parsed once (failures are cached as None too)
+        parsed_values: Dict[str, Optional[float]] = {}
+
+        for record in records:
+            ts = parsed_timestamps.get(id(record))
             if ts is None:
                 continue
-            
-            parsed_value = parse_metric_value(record.value, metric_name)
+
+            text = record.value
+            if text in parsed_values:
+                parsed_value = parsed_values[text]
+            else:
+                parsed_value = parse_metric_value(text, metric_name)
+                parsed_values[text] = parsed_value
             if parsed_value is None:
                 continue
-            
-            is_abnormal = config.is_abnormal(parsed_value)
-            
-            data_points.append(MetricDataPoint(
+
+            data_points[count] = MetricDataPoint(
                 timestamp=ts,
                 value=parsed_value,
-                is_abnormal=is_abnormal,
-            ))
-        
+                is_abnormal=not (low <= parsed_value <= high),
+            )
+            count += 1
+
+        del data_points[count:]
+
+        # Unit comes from the earliest record, falling back to the config
+        unit = records[0].unit if records else None
+
         return PreparedMetricData(
             metric_name=metric_name,
             config=config,
-            unit=unit,
+            unit=unit or config.unit,
             data_points=data_points,
         )
 
     def _prepare_blood_pressure(
         self,
-        records_by_type: Dict[str, List[HealthRecordResponse]],
+        records_by_type: Dict[str, List[GraphRecord]],
+        parsed_timestamps: Optional[Dict[int, datetime]] = None,
     ) -> Optional[PreparedBloodPressureData]:
         """
         Prepare blood pressure data with aligned systolic/diastolic readings.
@@ -293,6 +474,11 @@ class DataPreparationService:
         if 'systolic' not in records_by_type or 'diastolic' not in records_by_type:
             return None
         
+        if parsed_timestamps is None:
+            parsed_timestamps = self._parse_timestamps(
+                records_by_type['systolic'] + records_by_type['diastolic']
+            )
+        
         sys_records = records_by_type['systolic']
         dia_records = records_by_type['diastolic']
         
@@ -301,7 +487,7 @@ class DataPreparationService:
         diastolic_by_ts: Dict[datetime, float] = {}
         
         for record in sys_records:
-            ts = parse_timestamp(record.timestamp, record_id=getattr(record, 'id', None))
+            ts = parsed_timestamps.get(id(record))
             if ts is None:
                 continue
             val = parse_metric_value(record.value, 'systolic')
@@ -309,7 +495,7 @@ class DataPreparationService:
                 systolic_by_ts[ts] = val
         
         for record in dia_records:
-            ts = parse_timestamp(record.timestamp, record_id=getattr(record, 'id', None))
+            ts = parsed_timestamps.get(id(record))
             if ts is None:
                 continue
             val = parse_metric_value(record.value, 'diastolic')
@@ -379,17 +565,25 @@ class DataPreparationService:
         metrics: Dict[str, PreparedMetricData],
         blood_pressure: Optional[PreparedBloodPressureData],
     ) -> Tuple[datetime, datetime]:
-        """Calculate the date range across all data."""
-        all_timestamps: List[datetime] = []
+        """
+        Calculate the date range across all data.
+        
+        Data points are already sorted chronologically, so only the first
+        and last timestamp of each series are compared.
+        """
+        endpoints: List[datetime] = []
         
         for metric_data in metrics.values():
-            all_timestamps.extend(metric_data.timestamps)
+            if metric_data.data_points:
+                endpoints.append(metric_data.data_points[0].timestamp)
+                endpoints.append(metric_data.data_points[-1].timestamp)
         
-        if blood_pressure:
-            all_timestamps.extend(blood_pressure.timestamps)
+        if blood_pressure and blood_pressure.data_points:
+            endpoints.append(blood_pressure.data_points[0].timestamp)
+            endpoints.append(blood_pressure.data_points[-1].timestamp)
         
-        if all_timestamps:
-            return (min(all_timestamps), max(all_timestamps))
+        if endpoints:
+            return (min(endpoints), max(endpoints))
         
         now = datetime.now()
         return (now, now)
@@ -403,24 +597,16 @@ class DataPreparationService:
         
         Returns summaries sorted by clinical priority.
         """
-        # Priority order for summary display
-        priority = (
-            'creatinine', 'blood urea', 'random blood sugar',
-            'haemoglobin', 'sodium', 'potassium'
+        # Sort metrics: priority first (by canonical name), then alphabetically
+        unranked = len(_SUMMARY_PRIORITY)
+        sorted_metric_names = sorted(
+            metrics,
+            key=lambda name: (
+                _SUMMARY_PRIORITY.get(metrics[name].config.canonical_name, unranked),
+                name,
+            ),
         )
         
-        # Sort metrics: priority first, then alphabetically
-        sorted_metric_names: List[str] = []
-        for p in priority:
-            for metric_name in metrics:
-                config = get_metric_config(metric_name)
-                if (metric_name == p or config.canonical_name == p) and metric_name not in sorted_metric_names:
-                    sorted_metric_names.append(metric_name)
-                    break
-        for metric_name in sorted(metrics.keys()):
-            if metric_name not in sorted_metric_names:
-                sorted_metric_names.append(metric_name)
-        
         summaries: List[MetricSummary] = []
         
         for metric_name in sorted_metric_names[:5]:
@@ -431,9 +617,9 @@ class DataPreparationService:
             # Get latest data point
             latest_dp = metric_data.data_points[-1]
             
-            # Calculate trend from values
-            values = metric_data.values
-            trend = calculate_trend(values)
+            # Calculate trend; it only depends on the last two readings, so
+            # avoid materializing the full value list
+            trend = calculate_trend([dp.value for dp in metric_data.data_points[-2:]])
             
             summaries.append(MetricSummary(
                 metric_name=metric_name,
@@ -10,7 +10,7 @@ Features:
 - Educational metric descriptions in tooltips
 - Summary panel with latest readings
 - Date range filters and slider
-- Spline curves for smooth visualization
+- WebGL (Scattergl) traces for blood pressure and metrics
 
 This module orchestrates data preparation and Plotly figure construction.
 Data preparation is delegated to DataPreparationService.
@@ -18,18 +18,116 @@ Figure construction is delegated to PlotlyBuilder.
 Metric configuration and parsing is handled by metric_registry.
 """
 
+import html
+import json
 import logging
-from typing import List, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Tuple
 
-import plotly.io as pio
-
-from schemas import HealthRecordResponse
-from services.graph.data_preparation_service import DataPreparationService
-from services.graph.plotly_builder import PlotlyBuilder
+from core.metric_registry import parse_timestamp
+from services.graph.data_preparation_service import DataPreparationService, GraphRecord
+from services.graph.plotly_builder import Figure, PlotlyBuilder
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HTML SHELL
+# =============================================================================
+# The page skeleton and the plotly.js CDN tag are identical for every graph,
+# so they are built once; only the figure JSON changes per request.
+
+# The page is split around the figure payload so the static head (plotly.js
+# tag, mobile CSS) and tail are built once and only the figure is serialized.
+_HTML_HEAD = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <style>html, body {{height: 100%;}}</style>
+    {plotlyjs}
+</head>
+<body>
+    <div id="health-graph" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+    <script>
+        Plotly.newPlot("health-graph", """
+
+_HTML_TAIL = """);
+    </script>
+</body>
+</html>"""
+
+
+# Below this many records an interactive chart adds little, so a static
+# table is returned instead (no plotly.js download, no figure build).
+MIN_RECORDS_FOR_GRAPH = 3
+
+# Stand-in for the patient name in the pre-rendered empty-graph page
+_PATIENT_PLACEHOLDER = '__HEALTH_GRAPH_PATIENT__'
+
+# Number of rendered pages kept per GraphService instance, and how long
+# each one may be served before it is rebuilt
+HTML_CACHE_SIZE = 128
+HTML_CACHE_TTL_SECONDS = 300
+
+_TABLE_HEAD = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <style>
+        table { width: 100%; border-collapse: collapse; background: white; font-size: 14px; }
+        caption { font-weight: bold; font-size: 18px; padding: 12px; }
+        th, td { padding: 8px; text-align: left; border-bottom: 1px solid #EEEEEE; }
+        th { color: #757575; font-weight: normal; }
+    </style>
+</head>
+<body>"""
+
+_TABLE_BODY = """
+    <table id="health-table">
+        <caption>Health Records<br><small style="color:#757575">{patient}</small></caption>
+        <tr><th>Date</th><th>Metric</th><th>Value</th></tr>
+        {rows}
+    </table>
+</body>
+</html>"""
+
+
+@lru_cache(maxsize=1)
+def _plotlyjs_script_tags() -> str:
+    """
+    Script tags that load plotly.js from the versioned CDN.
+    
+    Plotly computes an SRI hash over the whole bundled plotly.js every time
+    it renders with include_plotlyjs='cdn'; this extracts the resulting tags
+    once and reuses them.
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    fragment = pio.to_html(go.Figure(), include_plotlyjs='cdn', full_html=False)
+    head = fragment[:fragment.index('class="plotly-graph-div"')]
+    return '\n    '.join(re.findall(r'<script[^>]*>.*?</script>', head, re.DOTALL))
+
+
+def _json_string_fragment(text: str) -> str:
+    """
+    Encode text for substitution inside a JSON string in a script block.
+    
+    Mirrors Plotly's HTML-safe JSON output by escaping '<', '>' and '/'.
+    """
+    return (
+        json.dumps(text)[1:-1]
+        .replace('<', '\\u003c')
+        .replace('>', '\\u003e')
+        .replace('/', '\\u002f')
+    )
+
+
 # =============================================================================
 # GRAPH SERVICE
 # =============================================================================
@@ -47,6 +145,11 @@ class GraphService:
     This class focuses on orchestrating the flow between these components.
     """
 
+    __slots__ = (
+        '_data_prep', '_builder', '_html_cache', '_html_cache_lock',
+        '_empty_graph_template', '_page_frame', '_table_head',
+    )
+
     def __init__(
         self,
         data_preparation_service: Optional[DataPreparationService] = None,
@@ -63,12 +166,84 @@ class GraphService:
         """
         self._data_prep = data_preparation_service or DataPreparationService()
         self._builder = plotly_builder or PlotlyBuilder()
+        self._html_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+        # Page renders run in worker threads
+        self._html_cache_lock = threading.Lock()
+        self._empty_graph_template: Optional[str] = None
+        self._page_frame: Optional[Tuple[str, str]] = None
+        self._table_head: Optional[str] = None
+
+    def generate_html_graph(self, records: List[GraphRecord], patient_name: str) -> str:
+        """
+        Generate complete HTML with interactive Plotly graph.
+        
+        Output depends only on the patient name and the records' rendered
+        fields, so repeat views of an unchanged chart are served from a small
+        LRU cache without rebuilding the figure or serializing it. New or
+        edited records change the key and re-render; entries also expire after
+        HTML_CACHE_TTL_SECONDS so pages of inactive patients are released.
+        """
+        key = (
+            patient_name,
+            tuple((r.timestamp, r.record_type, r.value, r.unit) for r in records),
+        )
+        cached = self._get_cached_html(key)
+        if cached is not None:
+            return cached
 
-    def generate_html_graph(self, records: List[HealthRecordResponse], patient_name: str) -> str:
-        """Generate complete HTML with interactive Plotly graph."""
         if not records:
-            return self._generate_empty_graph(patient_name)
+            html_content = self._generate_empty_graph(patient_name)
+        elif len(records) < MIN_RECORDS_FOR_GRAPH:
+            html_content = self._generate_simple_table(records, patient_name)
+        else:
+            html_content = self._render_html(self._build_figure(records, patient_name))
+        self._store_cached_html(key, html_content)
+        return html_content
+
+    def generate_graph_json(
+        self, records: List[GraphRecord], patient_name: str
+    ) -> str:
+        """
+        Serialize the figure as a JSON object with data, layout and config.
+        
+        For clients that already hold plotly.js and the page shell and only
+        need the figure, e.g. to call Plotly.react. Unlike the HTML view,
+        small record sets are returned as a figure rather than a table.
+        """
+        if records:
+            fig = self._build_figure(records, patient_name)
+        else:
+            fig = self._builder.create_figure()
+            self._builder.apply_empty_layout(fig, patient_name)
+        data_json, layout_json = self._serialize_figure(fig)
+        config_json = json.dumps(self._builder.get_mobile_config())
+        return f'{{"data": {data_json}, "layout": {layout_json}, "config": {config_json}}}'
+
+    def _get_cached_html(self, key: Tuple) -> Optional[str]:
+        """Return a cached page if present and not expired."""
+        with self._html_cache_lock:
+            cached = self._html_cache.get(key)
+            if cached is None:
+                return None
+            expires_at, html_content = cached
+            if time.monotonic() >= expires_at:
+                del self._html_cache[key]
+                return None
+            self._html_cache.move_to_end(key)
+            return html_content
 
+    def _store_cached_html(self, key: Tuple, html_content: str) -> None:
+        """Cache a rendered page, evicting the least recently used entry."""
+        with self._html_cache_lock:
+            self._html_cache[key] = (time.monotonic() + HTML_CACHE_TTL_SECONDS, html_content)
+            self._html_cache.move_to_end(key)
+            if len(self._html_cache) > HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+
+    def _build_figure(
+        self, records: List[GraphRecord], patient_name: str
+    ) -> Figure:
+        """Build the interactive figure for a non-trivial set of records."""
         # Delegate all data preparation to the dedicated service
         dataset = self._data_prep.prepare_dataset(records)
         
@@ -79,33 +254,101 @@ class GraphService:
         if dataset.blood_pressure and not dataset.blood_pressure.is_empty():
             self._builder.add_blood_pressure_trace(fig, dataset.blood_pressure)
 
-        # Add standard traces
-        for metric_name, metric_data in dataset.metrics.items():
-            is_visible = metric_name in dataset.visible_metrics
-            trace = self._builder.create_metric_trace(metric_data, is_visible)
-            fig.add_trace(trace)
+        # Add standard traces (one per category/axis group)
+        self._builder.add_metric_traces(fig, dataset.metrics, dataset.visible_metrics)
 
         # Apply layout and add summary
         self._builder.apply_layout(fig, patient_name)
         self._builder.add_summary_panel(fig, dataset.summaries, dataset.date_range[1])
 
-        html_content = pio.to_html(
-            fig,
-            include_plotlyjs='cdn',
-            config=self._builder.get_mobile_config(),
-            div_id="health-graph"
+        return fig
+
+    def _generate_empty_graph(self, patient_name: str) -> str:
+        """
+        Generate styled placeholder graph when no records exist.
+        
+        The page differs only by patient name, so it is rendered once with a
+        placeholder and the JSON-escaped name is substituted on each call.
+        """
+        if self._empty_graph_template is None:
+            fig = self._builder.create_figure()
+            self._builder.apply_empty_layout(fig, _PATIENT_PLACEHOLDER)
+            self._empty_graph_template = self._render_html(fig)
+        
+        return self._empty_graph_template.replace(
+            _PATIENT_PLACEHOLDER, _json_string_fragment(patient_name)
         )
 
-        return self._builder.inject_mobile_css(html_content)
+    def _generate_simple_table(
+        self, records: List[GraphRecord], patient_name: str
+    ) -> str:
+        """
+        Generate a static HTML table for very small record sets (no Plotly).
+        
+        The mobile-enhanced head is built once per instance and the table
+        body is appended to it, so the page is never rescanned.
+        """
+        rows: List[str] = []
+        for record in sorted(records, key=attrgetter('timestamp')):
+            ts = parse_timestamp(record.timestamp)
+            date_text = ts.strftime('%b %d, %Y') if ts else record.timestamp
+            value_text = f"{record.value} {record.unit}" if record.unit else record.value
+            rows.append(
+                f"<tr><td>{html.escape(date_text)}</td>"
+                f"<td>{html.escape(record.record_type.title())}</td>"
+                f"<td><b>{html.escape(value_text)}</b></td></tr>"
+            )
+        if self._table_head is None:
+            self._table_head = self._builder.inject_mobile_css(_TABLE_HEAD)
+        return self._table_head + _TABLE_BODY.format(
+            patient=html.escape(patient_name),
+            rows='\n        '.join(rows),
+        )
 
-    def _generate_empty_graph(self, patient_name: str) -> str:
-        """Generate styled placeholder graph when no records exist."""
-        fig = self._builder.create_figure()
-        self._builder.apply_empty_layout(fig, patient_name)
+    def _render_html(self, fig: Figure) -> str:
+        """Render a figure into the cached HTML shell with mobile enhancements."""
+        return self._render_head() + self._render_figure_script(fig)
+
+    def _render_head(self) -> str:
+        """Render the static page head, up to the figure payload."""
+        return self._get_page_frame()[0]
+
+    def _get_page_frame(self) -> Tuple[str, str]:
+        """
+        Return the static (head, tail) around the figure data and layout.
         
-        html = pio.to_html(
-            fig,
-            include_plotlyjs='cdn',
-            config=self._builder.get_mobile_config()
+        The head (plotly.js tags and mobile CSS) and the tail (serialized
+        config and closing tags) are identical for every graph, so they are
+        built once per instance; the figure payload is concatenated between
+        them without rescanning the page.
+        """
+        if self._page_frame is None:
+            head = self._builder.inject_mobile_css(
+                _HTML_HEAD.format(plotlyjs=_plotlyjs_script_tags())
+            )
+            tail = ', ' + json.dumps(self._builder.get_mobile_config()) + _HTML_TAIL
+            self._page_frame = (head, tail)
+        return self._page_frame
+
+    def _render_figure_script(self, fig: Figure) -> str:
+        """
+        Serialize the figure payload and close the page.
+        
+        Only the figure data and layout are serialized per call. The figure
+        is a plain dict, serialized with Plotly's to_json_plotly: the 'auto'
+        engine encodes with orjson (C-level, native datetime support) and
+        falls back to PlotlyJSONEncoder if it is missing. Both escape
+        HTML-sensitive characters, so user text (e.g. patient names) cannot
+        break out of the script block.
+        """
+        data_json, layout_json = self._serialize_figure(fig)
+        return data_json + ', ' + layout_json + self._get_page_frame()[1]
+
+    def _serialize_figure(self, fig: Figure) -> Tuple[str, str]:
+        """Serialize figure data and layout to HTML-safe JSON strings."""
+        from plotly.io.json import to_json_plotly
+
+        return (
+            to_json_plotly(fig['data'], engine='auto'),
+            to_json_plotly(fig['layout'], engine='auto'),
         )
-        return self._builder.inject_mobile_css(html)
@@ -9,14 +9,18 @@ Responsibilities:
 
 This module encapsulates all Plotly-specific figure construction logic,
 allowing GraphService to focus on orchestration.
+
+Figures are plain dicts in Plotly's JSON shape ({"data": [...], "layout": {...}})
+rather than plotly.graph_objects instances, which validate every property
+on assignment; that validation dominated graph build time.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
-import plotly.graph_objects as go
-
 from core.metric_registry import (
     MetricConfig,
     get_metric_config,
@@ -31,6 +35,206 @@ from services.graph.data_preparation_service import (
 
 logger = logging.getLogger(__name__)
 
+# A figure in Plotly's JSON shape: {"data": [trace, ...], "layout": {...}}
+Figure = Dict[str, Any]
+
+# Plotly axis IDs for the registry's axis names; the first Y-axis is "y",
+# not "y1" (graph_objects used to normalize this on assignment)
+_AXIS_IDS = {'y1': 'y'}
+
+# Per-point marker style for abnormal values:
+# (color, symbol, size, line color, line width, opacity)
+# UX: Enhanced abnormal marker visibility
+# - Larger size differential for quick scanning
+# - Higher opacity contrast for accessibility
+# - Distinct border color for additional differentiation
+_ABNORMAL_MARKER_STYLE = ('#D32F2F', 'diamond', 16, '#FFCDD2', 2.5, 0.95)
+
+# Mobile-optimized Plotly config (read-only, shared across requests)
+_MOBILE_CONFIG: Dict[str, Any] = {
+    'displayModeBar': True,
+    'displaylogo': False,
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d', 'autoScale2d'],
+    'responsive': True,
+    'scrollZoom': True,
+    'doubleClick': 'reset',
+    'toImageButtonOptions': {
+        'format': 'png',
+        'filename': 'health_records',
+        'height': 800,
+        'width': 1200,
+        'scale': 2
+    },
+}
+
+# Placeholder annotations for the empty graph (copied into each figure)
+_EMPTY_GRAPH_ANNOTATIONS = (
+    dict(text='📊', xref='paper', yref='paper', x=0.5, y=0.6,
+         showarrow=False, font=dict(size=48)),
+    dict(text='<b>No health records yet</b>', xref='paper', yref='paper',
+         x=0.5, y=0.42, showarrow=False, font=dict(size=18, color='#424242')),
+    dict(text='Upload a lab report to see your health trends',
+         xref='paper', yref='paper', x=0.5, y=0.32,
+         showarrow=False, font=dict(size=14, color='#757575')),
+)
+
+# Static layout for the interactive graph; apply_layout deep-copies it into
+# each figure, so the per-patient title, annotations and template sit on top.
+_BASE_LAYOUT: Dict[str, Any] = {
+    'xaxis': dict(
+        # No title - dates are self-explanatory from axis labels
+        type="date",
+        showgrid=True,
+        gridcolor='rgba(0,0,0,0.06)',  # UX: Lighter grid
+        tickformat='%b %d',  # Default format; mobile override via JS
+        tickangle=-45,  # UX: Angled labels prevent overlap
+        nticks=8,  # UX: Limit tick density for readability
+        rangeselector=dict(
+            buttons=[
+                dict(count=1, label="1M", step="month", stepmode="backward"),
+                dict(count=3, label="3M", step="month", stepmode="backward"),
+                dict(count=6, label="6M", step="month", stepmode="backward"),
+                dict(count=1, label="1Y", step="year", stepmode="backward"),
+                dict(step="all", label="All"),
+            ],
+            bgcolor='rgba(255,255,255,0.95)',
+            activecolor='#E3F2FD',
+            font=dict(size=11),  # UX: Smaller range selector text
+        ),
+        rangeslider=dict(visible=True, thickness=0.04),  # UX: Thinner slider
+    ),
+    # Primary Y-axis (left) for larger values
+    'yaxis': dict(
+        title=dict(text="Primary", font=dict(size=11, color='#9E9E9E')),  # UX: Muted axis title
+        side="left",
+        showgrid=True,
+        gridcolor='rgba(0,0,0,0.06)',
+    ),
+    # Secondary Y-axis (right) for small decimal values
+    'yaxis2': dict(
+        title=dict(text="Micro", font=dict(size=11, color='#9E9E9E')),  # UX: Muted axis title
+        side="right",
+        overlaying="y",
+        showgrid=False,
+    ),
+    'hovermode': 'x unified',
+    'legend': dict(
+        orientation="h",
+        x=0.5, xanchor="center",
+        y=-0.12, yanchor="top",  # UX: Moved closer to plot
+        font=dict(size=11, color='#424242'),
+        bgcolor="rgba(255,255,255,0.9)",
+        bordercolor="rgba(0,0,0,0.08)",  # UX: Lighter border
+        borderwidth=1,
+        # UX: Responsive grid layout for legend items
+        entrywidth=0.28,  # Slightly narrower for tighter layout
+        entrywidthmode="fraction",
+        itemwidth=30,  # Minimum allowed by Plotly is 30
+        tracegroupgap=4,  # UX: Reduced vertical gap between rows
+        # Clicking a metric toggles only that metric, not its whole group
+        groupclick='toggleitem',
+        itemsizing='constant',
+    ),
+    'height': 700,  # UX: Reduced overall height
+    'margin': dict(l=50, r=50, t=90, b=140),  # UX: Tighter margins
+    'paper_bgcolor': '#FAFAFA',
+    'plot_bgcolor': '#FFFFFF',
+    'dragmode': 'pan',
+    'hoverlabel': dict(
+        bgcolor="white",
+        font=dict(size=12),
+        bordercolor='rgba(0,0,0,0.1)',
+    ),
+}
+
+# Mobile-responsive CSS and JavaScript injected right after <body>
+_MOBILE_ENHANCEMENTS = """
+        <style>
+            * { box-sizing: border-box; }
+            body {
+                margin: 0;
+                padding: 8px;
+                background: #FAFAFA;
+                font-family: -apple-system, system-ui, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+                -webkit-font-smoothing: antialiased;
+            }
+            #health-graph {
+                width: 100% !important;
+                max-width: 100%;
+                border-radius: 10px;
+                box-shadow: 0 1px 4px rgba(0,0,0,0.06);
+                background: white;
+            }
+            .js-plotly-plot { width: 100% !important; }
+            .legend .traces { cursor: pointer; }
+            
+            /* UX: Tablet and below */
+            @media (max-width: 768px) {
+                body { padding: 4px; }
+                #health-graph { border-radius: 8px; }
+                .modebar { display: none !important; }
+                /* UX: Compact legend on tablet */
+                .legend .legendtext { font-size: 10px !important; }
+            }
+            
+            /* UX: Mobile - aggressive space optimization */
+            @media (max-width: 480px) {
+                body { padding: 2px; }
+                .legend .legendtext { font-size: 9px !important; }
+                /* UX: Hide secondary annotations on very small screens */
+                .annotation-text { font-size: 8px !important; }
+            }
+        </style>
+        
+        <script>
+        // UX: Responsive X-axis date formatting
+        // Mobile shows month-only labels to prevent overlap
+        (function() {
+            function updateTickFormat() {
+                var graphDiv = document.getElementById('health-graph');
+                if (!graphDiv || !graphDiv.layout) return;
+                
+                var isMobile = window.innerWidth < 600;
+                var tickFormat = isMobile ? '%b' : '%b %d';  // Month-only on mobile
+                var nticks = isMobile ? 5 : 8;  // Fewer ticks on mobile
+                
+                Plotly.relayout(graphDiv, {
+                    'xaxis.tickformat': tickFormat,
+                    'xaxis.nticks': nticks
+                });
+            }
+            
+            // Apply on load and resize
+            window.addEventListener('load', function() {
+                setTimeout(updateTickFormat, 100);
+            });
+            
+            var resizeTimeout;
+            window.addEventListener('resize', function() {
+                clearTimeout(resizeTimeout);
+                resizeTimeout = setTimeout(updateTickFormat, 150);
+            });
+        })();
+        </script>
+        """
+_BODY_WITH_MOBILE_ENHANCEMENTS = '<body>' + _MOBILE_ENHANCEMENTS
+
+
+@lru_cache(maxsize=None)
+def _template(name: str) -> Dict[str, Any]:
+    """
+    Return a named Plotly template as JSON.
+    
+    The cached value is never handed out directly; callers get a deep copy
+    so one figure's layout cannot leak into another.
+    
+    plotly.js does not know template names, so plain-dict layouts must carry
+    the expanded template that graph_objects would have embedded.
+    """
+    import plotly.io as pio
+
+    return pio.templates[name].to_plotly_json()
+
 
 class PlotlyBuilder:
     """
@@ -46,27 +250,32 @@ class PlotlyBuilder:
         builder = PlotlyBuilder()
         fig = builder.create_figure()
         builder.add_blood_pressure_trace(fig, bp_data)
-        builder.add_metric_trace(fig, metric_data, is_visible=True)
+        builder.add_metric_traces(fig, metrics, visible_metrics)
         builder.apply_layout(fig, patient_name)
         builder.add_summary_panel(fig, summaries, latest_date)
     """
 
-    def create_figure(self) -> go.Figure:
+    __slots__ = ()
+
+    def create_figure(self) -> Figure:
         """Create a new empty Plotly figure."""
-        return go.Figure()
+        return {"data": [], "layout": {}}
 
     def add_blood_pressure_trace(
-        self, fig: go.Figure, bp_data: PreparedBloodPressureData
+        self, fig: Figure, bp_data: PreparedBloodPressureData
     ) -> None:
         """
         Add specialized blood pressure high-low chart.
         
         Uses pre-aligned data from DataPreparationService where systolic and
-        diastolic values are guaranteed to be paired by timestamp.
+        diastolic values are guaranteed to be paired by timestamp. Both traces
+        use WebGL (Scattergl), so lines are drawn linearly rather than as splines.
         """
-        dates = bp_data.timestamps
-        sys_vals = bp_data.systolic_values
-        dia_vals = bp_data.diastolic_values
+        # Long histories are downsampled like other metrics
+        points = bp_data.downsampled()
+        dates = [dp.timestamp for dp in points]
+        sys_vals = [dp.systolic for dp in points]
+        dia_vals = [dp.diastolic for dp in points]
 
         # UX: Blood pressure traces have distinct visual styling
         # - Darker, bolder appearance vs other metrics
@@ -74,11 +283,12 @@ class PlotlyBuilder:
         # - Dash pattern on diastolic for additional differentiation
         
         # Systolic trace (top of BP range)
-        fig.add_trace(go.Scatter(
+        fig["data"].append(dict(
+            type='scattergl',
             x=dates, y=sys_vals,
             name="Systolic",  # UX: Minimal legend - no arrows
             mode='lines+markers',
-            line=dict(color='#263238', width=2.5, shape='spline'),  # Darker, slightly thinner
+            line=dict(color='#263238', width=2.5),  # Darker, slightly thinner
             marker=dict(
                 size=9,
                 color='#263238',
@@ -95,11 +305,12 @@ class PlotlyBuilder:
         ))
 
         # Diastolic trace with fill to systolic (bottom of BP range)
-        fig.add_trace(go.Scatter(
+        fig["data"].append(dict(
+            type='scattergl',
             x=dates, y=dia_vals,
             name="Diastolic",  # UX: Minimal legend - no arrows
             mode='lines+markers',
-            line=dict(color='#607D8B', width=2.5, shape='spline', dash='dot'),  # UX: Dotted line distinguishes from systolic
+            line=dict(color='#607D8B', width=2.5, dash='dot'),  # UX: Dotted line distinguishes from systolic
             marker=dict(
                 size=9,
                 color='#607D8B',
@@ -117,11 +328,35 @@ class PlotlyBuilder:
             ),
         ))
 
+    def add_metric_traces(
+        self,
+        fig: Figure,
+        metrics: Dict[str, PreparedMetricData],
+        visible_metrics: List[str],
+    ) -> None:
+        """
+        Add one trace per metric, grouped in the legend by (category, axis).
+        
+        Each metric keeps its own trace so the unified x-hover lists every
+        value recorded at a timestamp (e.g. a whole lipid panel) and each
+        metric keeps its color and legend toggle. Metrics sharing a category
+        and Y-axis share a legend group so related traces sit together.
+        """
+        for metric_name, metric_data in metrics.items():
+            is_visible = metric_name in visible_metrics
+            fig["data"].append(self.create_metric_trace(metric_data, is_visible))
+
     def create_metric_trace(
         self, metric_data: PreparedMetricData, is_visible: bool
-    ) -> go.Scatter:
+    ) -> Dict[str, Any]:
         """
-        Create a Plotly trace with spline curves, value labels, and abnormal highlighting.
+        Create a WebGL Plotly trace with value labels and abnormal highlighting.
+        
+        Uses Scattergl so markers and lines are rasterized on the GPU instead
+        of as individual SVG DOM elements. WebGL traces do not support spline
+        interpolation, so lines are drawn linearly. Value labels are drawn
+        only for the latest and abnormal points, keeping the number of text
+        elements independent of history length.
         
         Abnormal values are shown with:
         - Different marker symbol (diamond vs circle)
@@ -133,42 +368,43 @@ class PlotlyBuilder:
         Units and trends are shown in tooltips and summary panel instead.
         """
         config = metric_data.config
-        values = metric_data.values
-        is_abnormal = metric_data.is_abnormal
         unit = metric_data.unit
-        
+
         # UX: Keep legend labels minimal - metric name only
         # Secondary info (units, trends) moved to tooltips and summary panel
         name = metric_data.metric_name.title()
 
-        # UX: Enhanced abnormal marker visibility
-        # - Larger size differential for quick scanning
-        # - Higher opacity contrast for accessibility
-        # - Distinct border color for additional differentiation
-        marker_colors = [
-            '#D32F2F' if abnormal else config.color  # Slightly deeper red for abnormal
-            for abnormal in is_abnormal
-        ]
-        marker_symbols = [
-            'diamond' if abnormal else 'circle'
-            for abnormal in is_abnormal
-        ]
-        marker_sizes = [
-            16 if abnormal else 11  # Increased size contrast (was 14 vs 12)
-            for abnormal in is_abnormal
-        ]
-        # UX: Subtle border color hint for abnormal values
-        marker_line_colors = [
-            '#FFCDD2' if abnormal else 'white'  # Light red border for abnormal
-            for abnormal in is_abnormal
-        ]
-        marker_line_widths = [
-            2.5 if abnormal else 2
-            for abnormal in is_abnormal
-        ]
-
-        # Value labels with smart formatting
-        text_labels = [format_metric_value(v) for v in values]
+        # Long series are downsampled so payload size stays bounded
+        points = metric_data.downsampled()
+        normal_style = (config.color, 'circle', 11, 'white', 2, 0.9)
+
+        marker_colors: List[str] = []
+        marker_symbols: List[str] = []
+        marker_sizes: List[int] = []
+        marker_line_colors: List[str] = []
+        marker_line_widths: List[float] = []
+        marker_opacities: List[float] = []
+        text_labels: List[str] = []
+
+        last_index = len(points) - 1
+        for point_index, dp in enumerate(points):
+            # UX: Label only the latest and abnormal readings; every
+            # other value is still available in the hover tooltip.
+            if point_index == last_index or dp.is_abnormal:
+                text_labels.append(format_metric_value(dp.value))
+            else:
+                text_labels.append('')
+
+            # Select the whole marker style once per point
+            color, symbol, size, line_color, line_width, opacity = (
+                _ABNORMAL_MARKER_STYLE if dp.is_abnormal else normal_style
+            )
+            marker_colors.append(color)
+            marker_symbols.append(symbol)
+            marker_sizes.append(size)
+            marker_line_colors.append(line_color)
+            marker_line_widths.append(line_width)
+            marker_opacities.append(opacity)
 
         # UX: Enhanced tooltip with reference range information
         # Provides clinical context without cluttering the graph
@@ -177,9 +413,9 @@ class PlotlyBuilder:
         if config.range:
             low, high = config.range
             range_line = f"<span style='color:#666'>Normal: {low}–{high} {unit}</span><br>"
-        
+
         hovertemplate = (
-            f"<b>{metric_data.metric_name.title()}</b><br>"
+            f"<b>{name}</b><br>"
             f"{desc_line}"
             f"{range_line}"
             "%{x|%b %d, %Y}<br>"
@@ -187,20 +423,22 @@ class PlotlyBuilder:
             "<extra></extra>"
         )
 
-        return go.Scatter(
-            x=metric_data.timestamps,
-            y=values,
-            yaxis=config.axis,
+        return dict(
+            type='scattergl',
+            x=[dp.timestamp for dp in points],
+            y=[dp.value for dp in points],
+            yaxis=_AXIS_IDS.get(config.axis, config.axis),
             name=name,
+            legendgroup=f"{config.category}-{config.axis}",
             visible=True if is_visible else "legendonly",
             mode='lines+markers+text',
-            line=dict(width=3, color=config.color, shape='spline'),  # Slightly thinner line
+            line=dict(width=3, color=config.color),
             marker=dict(
                 size=marker_sizes,
                 color=marker_colors,
                 symbol=marker_symbols,
                 line=dict(width=marker_line_widths, color=marker_line_colors),
-                opacity=[0.95 if abnormal else 0.9 for abnormal in is_abnormal],  # UX: Subtle opacity boost for abnormal
+                opacity=marker_opacities,
             ),
             text=text_labels,
             textposition='top center',
@@ -210,7 +448,7 @@ class PlotlyBuilder:
         )
 
     def add_reference_band(
-        self, fig: go.Figure, record_type: str, date_range: Tuple[datetime, datetime]
+        self, fig: Figure, record_type: str, date_range: Tuple[datetime, datetime]
     ) -> None:
         """Add subtle reference range band for a metric."""
         config = get_metric_config(record_type)
@@ -224,17 +462,17 @@ class PlotlyBuilder:
         x0 = date_range[0] - timedelta(days=7)
         x1 = date_range[1] + timedelta(days=7)
 
-        fig.add_shape(
+        fig["layout"].setdefault("shapes", []).append(dict(
             type="rect",
             x0=x0, x1=x1,
             y0=low, y1=high,
-            yref=config.axis,
+            yref=_AXIS_IDS.get(config.axis, config.axis),
             fillcolor=fill_color,
             line=dict(width=0),
             layer="below",
-        )
+        ))
 
-    def apply_layout(self, fig: go.Figure, patient_name: str) -> None:
+    def apply_layout(self, fig: Figure, patient_name: str) -> None:
         """
         Apply layout with dual Y-axis support.
         
@@ -242,88 +480,28 @@ class PlotlyBuilder:
         - Tighter vertical spacing (reduced bottom margin)
         - Cleaner legend with minimal labels
         - Mobile-friendly date tick density via JavaScript injection
+        
+        The help annotation is applied in the same layout update.
         """
-        fig.update_layout(
+        layout = fig["layout"]
+        layout.update(
+            copy.deepcopy(_BASE_LAYOUT),
+            template=copy.deepcopy(_template("plotly_white")),
+            annotations=[*layout.get("annotations", ()), self.build_help_annotation()],
             title=dict(
                 text=f"<b>Health Trends</b><br><sup style='color:#757575'>{patient_name}</sup>",
                 font=dict(size=18),  # UX: Slightly smaller title
                 x=0.5, xanchor="center"
             ),
-            xaxis=dict(
-                # No title - dates are self-explanatory from axis labels
-                type="date",
-                showgrid=True,
-                gridcolor='rgba(0,0,0,0.06)',  # UX: Lighter grid
-                tickformat='%b %d',  # Default format; mobile override via JS
-                tickangle=-45,  # UX: Angled labels prevent overlap
-                nticks=8,  # UX: Limit tick density for readability
-                rangeselector=dict(
-                    buttons=[
-                        dict(count=1, label="1M", step="month", stepmode="backward"),
-                        dict(count=3, label="3M", step="month", stepmode="backward"),
-                        dict(count=6, label="6M", step="month", stepmode="backward"),
-                        dict(count=1, label="1Y", step="year", stepmode="backward"),
-                        dict(step="all", label="All"),
-                    ],
-                    bgcolor='rgba(255,255,255,0.95)',
-                    activecolor='#E3F2FD',
-                    font=dict(size=11),  # UX: Smaller range selector text
-                ),
-                rangeslider=dict(visible=True, thickness=0.04),  # UX: Thinner slider
-            ),
-            # Primary Y-axis (left) for larger values
-            yaxis=dict(
-                title=dict(text="Primary", font=dict(size=11, color='#9E9E9E')),  # UX: Muted axis title
-                side="left",
-                showgrid=True,
-                gridcolor='rgba(0,0,0,0.06)',
-            ),
-            # Secondary Y-axis (right) for small decimal values
-            yaxis2=dict(
-                title=dict(text="Micro", font=dict(size=11, color='#9E9E9E')),  # UX: Muted axis title
-                side="right",
-                overlaying="y",
-                showgrid=False,
-            ),
-            hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                x=0.5, xanchor="center",
-                y=-0.12, yanchor="top",  # UX: Moved closer to plot
-                font=dict(size=11, color='#424242'),
-                bgcolor="rgba(255,255,255,0.9)",
-                bordercolor="rgba(0,0,0,0.08)",  # UX: Lighter border
-                borderwidth=1,
-                # UX: Responsive grid layout for legend items
-                entrywidth=0.28,  # Slightly narrower for tighter layout
-                entrywidthmode="fraction",
-                itemwidth=30,  # Minimum allowed by Plotly is 30
-                tracegroupgap=4,  # UX: Reduced vertical gap between rows
-                itemsizing='constant',
-            ),
-            height=700,  # UX: Reduced overall height
-            margin=dict(l=50, r=50, t=90, b=140),  # UX: Tighter margins
-            template="plotly_white",
-            paper_bgcolor='#FAFAFA',
-            plot_bgcolor='#FFFFFF',
-            dragmode='pan',
-            hoverlabel=dict(
-                bgcolor="white",
-                font_size=12,
-                bordercolor='rgba(0,0,0,0.1)',
-            ),
         )
 
-        # Add help annotation
-        self.add_help_annotation(fig)
-
-    def add_help_annotation(self, fig: go.Figure) -> None:
+    def build_help_annotation(self) -> Dict[str, Any]:
         """
-        Add compact help annotation positioned below the legend.
+        Build compact help annotation positioned below the legend.
         
         Provides guidance on interaction without cluttering the visualization.
         """
-        fig.add_annotation(
+        return dict(
             text="<i>Tap legend to show/hide  •  ◆ outside range  •  Right axis = micro values</i>",
             xref="paper", yref="paper",
             x=0.5, y=-0.18,  # UX: Moved closer to legend
@@ -333,7 +511,7 @@ class PlotlyBuilder:
         )
 
     def add_summary_panel(
-        self, fig: go.Figure, summaries: List[MetricSummary], latest_date: datetime
+        self, fig: Figure, summaries: List[MetricSummary], latest_date: datetime
     ) -> None:
         """
         Add summary panel with latest readings and trend indicators.
@@ -381,7 +559,7 @@ class PlotlyBuilder:
         header = f"<span style='color:#757575;font-size:10px'>LATEST • {latest_date.strftime('%b %d')}</span>"
         summary_text = header + "<br>" + "<br>".join(items)
         
-        fig.add_annotation(
+        fig["layout"].setdefault("annotations", []).append(dict(
             text=summary_text,
             xref="paper", yref="paper",
             x=1.0, y=1.0,
@@ -393,11 +571,11 @@ class PlotlyBuilder:
             bordercolor='rgba(0,0,0,0.06)',  # UX: Very subtle border
             borderwidth=1,
             borderpad=6,  # UX: Tighter padding
-        )
+        ))
 
-    def apply_empty_layout(self, fig: go.Figure, patient_name: str) -> None:
+    def apply_empty_layout(self, fig: Figure, patient_name: str) -> None:
         """Apply layout for empty graph (no records)."""
-        fig.update_layout(
+        fig["layout"].update(
             title=dict(
                 text=f"<b>Health Trends</b><br><sup>{patient_name}</sup>",
                 font=dict(size=20),
@@ -406,37 +584,19 @@ class PlotlyBuilder:
             xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
             yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
             height=450,
-            template="plotly_white",
+            template=copy.deepcopy(_template("plotly_white")),
             paper_bgcolor='#FAFAFA',
             plot_bgcolor='#FFFFFF',
-            annotations=[
-                dict(text='📊', xref='paper', yref='paper', x=0.5, y=0.6,
-                     showarrow=False, font=dict(size=48)),
-                dict(text='<b>No health records yet</b>', xref='paper', yref='paper',
-                     x=0.5, y=0.42, showarrow=False, font=dict(size=18, color='#424242')),
-                dict(text='Upload a lab report to see your health trends',
-                     xref='paper', yref='paper', x=0.5, y=0.32,
-                     showarrow=False, font=dict(size=14, color='#757575')),
-            ]
+            annotations=copy.deepcopy(list(_EMPTY_GRAPH_ANNOTATIONS)),
         )
 
     def get_mobile_config(self) -> Dict[str, Any]:
-        """Mobile-optimized Plotly config."""
-        return {
-            'displayModeBar': True,
-            'displaylogo': False,
-            'modeBarButtonsToRemove': ['lasso2d', 'select2d', 'autoScale2d'],
-            'responsive': True,
-            'scrollZoom': True,
-            'doubleClick': 'reset',
-            'toImageButtonOptions': {
-                'format': 'png',
-                'filename': 'health_records',
-                'height': 800,
-                'width': 1200,
-                'scale': 2
-            },
-        }
+        """
+        Mobile-optimized Plotly config.
+        
+        Returns the shared module-level dict; callers must treat it as read-only.
+        """
+        return _MOBILE_CONFIG
 
     def inject_mobile_css(self, html_content: str) -> str:
         """
@@ -447,74 +607,5 @@ class PlotlyBuilder:
         - Reduced legend text size on small screens
         - Smoother touch interactions
         """
-        mobile_enhancements = """
-        <style>
-            * { box-sizing: border-box; }
-            body {
-                margin: 0;
-                padding: 8px;
-                background: #FAFAFA;
-                font-family: -apple-system, system-ui, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-                -webkit-font-smoothing: antialiased;
-            }
-            #health-graph {
-                width: 100% !important;
-                max-width: 100%;
-                border-radius: 10px;
-                box-shadow: 0 1px 4px rgba(0,0,0,0.06);
-                background: white;
-            }
-            .js-plotly-plot { width: 100% !important; }
-            .legend .traces { cursor: pointer; }
-            
-            /* UX: Tablet and below */
-            @media (max-width: 768px) {
-                body { padding: 4px; }
-                #health-graph { border-radius: 8px; }
-                .modebar { display: none !important; }
-                /* UX: Compact legend on tablet */
-                .legend .legendtext { font-size: 10px !important; }
-            }
-            
-            /* UX: Mobile - aggressive space optimization */
-            @media (max-width: 480px) {
-                body { padding: 2px; }
-                .legend .legendtext { font-size: 9px !important; }
-                /* UX: Hide secondary annotations on very small screens */
-                .annotation-text { font-size: 8px !important; }
-            }
-        </style>
-        
-        <script>
-        // UX: Responsive X-axis date formatting
-        // Mobile shows month-only labels to prevent overlap
-        (function() {
-            function updateTickFormat() {
-                var graphDiv = document.getElementById('health-graph');
-                if (!graphDiv || !graphDiv.layout) return;
-                
-                var isMobile = window.innerWidth < 600;
-                var tickFormat = isMobile ? '%b' : '%b %d';  // Month-only on mobile
-                var nticks = isMobile ? 5 : 8;  // Fewer ticks on mobile
-                
-                Plotly.relayout(graphDiv, {
-                    'xaxis.tickformat': tickFormat,
-                    'xaxis.nticks': nticks
-                });
-            }
-            
-            // Apply on load and resize
-            window.addEventListener('load', function() {
-                setTimeout(updateTickFormat, 100);
-            });
-            
-            var resizeTimeout;
-            window.addEventListener('resize', function() {
-                clearTimeout(resizeTimeout);
-                resizeTimeout = setTimeout(updateTickFormat, 150);
-            });
-        })();
-        </script>
-        """
-        return html_content.replace('<body>', f'<body>{mobile_enhancements}')
+        return html_content.replace('<body>', _BODY_WITH_MOBILE_ENHANCEMENTS, 1)
 
@@ -12,9 +12,11 @@ Dependency Injection:
     Use core.dependencies.get_health_service() in routers with Depends().
 """
 import logging
+import sqlite3
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from models import HealthRecord
 from repositories import PatientRepository, HealthRecordRepository
 from schemas import HealthRecordResponse
 from core.exceptions import PatientNotFoundError, DatabaseError
@@ -22,6 +24,9 @@ from core.datetime_utils import to_utc, format_iso
 
 logger = logging.getLogger(__name__)
 
+# HealthRecordResponse fields, in HealthRecordRepository.get_all_rows() tuple order
+_RECORD_RESPONSE_FIELDS = ('timestamp', 'patient', 'record_type', 'value', 'unit', 'lab_name')
+
 
 class HealthService:
     """
@@ -31,6 +36,8 @@ class HealthService:
     validation, patient lookup, and coordination with repositories.
     """
     
+    __slots__ = ('_patient_repo', '_record_repo')
+    
     def __init__(
         self,
         patient_repository: PatientRepository,
@@ -82,12 +89,13 @@ class HealthService:
             logger.warning(f"Patient not found: {patient}")
             raise PatientNotFoundError(patient_name=patient)
         
+        # Normalize timestamp to UTC
+        utc_timestamp = to_utc(timestamp)
+        
+        # Only database failures map to DatabaseError; anything else is a bug
+        # and propagates to the framework's error handling unchanged
         try:
-            # Normalize timestamp to UTC
-            utc_timestamp = to_utc(timestamp)
-            
-            # Save the record and get the created record in a single transaction
-            _, record_dict = self._record_repo.save(
+            self._record_repo.save(
                 timestamp=utc_timestamp,
                 patient_id=patient_id,
                 record_type=record_type,
@@ -95,54 +103,68 @@ class HealthService:
                 unit=unit,
                 lab_name=lab_name
             )
-            
-            logger.info(f"Health record saved successfully for patient: {patient}")
-            return HealthRecordResponse(
-                timestamp=record_dict["timestamp"],
-                patient=record_dict["patient"],
-                record_type=record_dict["record_type"],
-                value=record_dict["value"],
-                unit=record_dict["unit"],
-                lab_name=record_dict["lab_name"]
-            )
-        except Exception as e:
-            logger.error(f"Database error saving health record: {e}", exc_info=True)
+        except sqlite3.Error as e:
+            logger.error("Database error saving health record", exc_info=True)
             raise DatabaseError(operation="save_record") from e
+        
+        logger.info(f"Health record saved successfully for patient: {patient}")
+        # Echo the stored fields rather than re-reading the inserted row
+        return HealthRecordResponse(
+            timestamp=format_iso(utc_timestamp),
+            patient=patient,
+            record_type=record_type,
+            value=value,
+            unit=unit,
+            lab_name=lab_name if lab_name is not None else "self"
+        )
     
     def get_records(
         self,
         patient: Optional[str] = None,
         record_type: Optional[str] = None,
         limit: Optional[int] = None
-    ) -> List[HealthRecordResponse]:
+    ) -> List[Dict[str, Any]]:
         """
         Get health records with filters.
         
+        Records are returned as plain dicts with HealthRecordResponse's
+        fields rather than model instances: list endpoints can return
+        hundreds of rows, and the values come straight from the database,
+        so per-row model construction and validation is skipped.
+        
         Args:
             patient: Filter by patient name (optional).
             record_type: Filter by record type (optional).
             limit: Maximum number of records to return (optional).
         
         Returns:
-            List of HealthRecordResponse objects.
+            List of dicts shaped like HealthRecordResponse.
         """
-        records = self._record_repo.get_all(
+        rows = self._record_repo.get_all_rows(
             patient_name=patient,
             record_type=record_type,
             limit=limit
         )
         
-        return [
-            HealthRecordResponse(
-                timestamp=format_iso(record.timestamp),
-                patient=record.patient,
-                record_type=record.record_type,
-                value=record.value,
-                unit=record.unit,
-                lab_name=record.lab_name
-            )
-            for record in records
-        ]
+        return [dict(zip(_RECORD_RESPONSE_FIELDS, row)) for row in rows]
+    
+    def get_graph_records(self, patient: str) -> List[HealthRecord]:
+        """
+        Get a patient's records for graph rendering.
+        
+        Returns the repository's HealthRecord domain objects directly, with
+        timestamps already parsed to UTC datetimes. The graph pipeline only
+        reads their attributes, so building and validating a
+        HealthRecordResponse per row (and re-parsing its ISO timestamp) is
+        skipped.
+        
+        Args:
+            patient: Patient name.
+        
+        Returns:
+            List of HealthRecord objects, newest first.
+        """
+        return self._record_repo.get_all(patient_name=patient)
     
     def save_lab_report_records(
         self,
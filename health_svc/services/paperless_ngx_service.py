@@ -3,6 +3,8 @@ Service for uploading medical documents to Paperless NGX using REST API.
 """
 import json
 import logging
+import mimetypes
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -17,10 +19,40 @@ from core.config import (
 
 logger = logging.getLogger(__name__)
 
+# MIME types for the document formats we expect to upload
+_CONTENT_TYPES: Dict[str, str] = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".tiff": "image/tiff",
+    ".tif": "image/tiff",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".txt": "text/plain",
+}
+
+
+@lru_cache(maxsize=4)
+def _get_http_client(timeout: int, verify_ssl: bool) -> httpx.Client:
+    """
+    Get the process-wide HTTP client for a timeout/SSL combination.
+    
+    Upload tasks construct a PaperlessNgxService per document; sharing the
+    client keeps its connection pool (and TLS sessions) alive between
+    uploads instead of reconnecting every time. Auth headers are sent per
+    request, so services with different tokens can share a client.
+    """
+    return httpx.Client(timeout=timeout, verify=verify_ssl)
+
 
 class PaperlessNgxService:
     """Service for uploading medical documents to Paperless NGX."""
     
+    __slots__ = ('base_url', 'api_token', 'timeout', 'verify_ssl', 'upload_endpoint', 'headers')
+    
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -135,17 +167,7 @@ class PaperlessNgxService:
                 searchable_title += f"\nReport Type: {hospital_info.get('report_type')}"
         
         # Prepare multipart form data
-        # Read file content
-        with open(document_path_obj, "rb") as file:
-            file_content = file.read()
-        
-        files = {
-            "document": (
-                document_path_obj.name,
-                file_content,
-                self._get_content_type(document_path_obj)
-            )
-        }
+        content_type = self._get_content_type(document_path_obj)
         
         data = {
             "title": searchable_title
@@ -158,52 +180,49 @@ class PaperlessNgxService:
         if document_type_id is not None:
             data["document_type"] = str(document_type_id)
         
+        # For tags, we need to send them as multiple form fields with the same name;
+        # httpx does this for list values
+        if tag_ids:
+            data["tags"] = [str(tag_id) for tag_id in tag_ids]
+        
         try:
             logger.info(
                 f"Uploading medical document to Paperless NGX: {document_path_obj.name} "
                 f"(Patient: {patient_name}, Hospital: {hospital_name})"
             )
             
-            # Make the upload request
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                # For tags, we need to send them as multiple form fields with the same name
-                # httpx supports this by using a list of tuples
-                if tag_ids:
-                    # Create form data with tags as multiple entries
-                    form_data = list(data.items())
-                    for tag_id in tag_ids:
-                        form_data.append(("tags", str(tag_id)))
-                    
-                    response = client.post(
-                        self.upload_endpoint,
-                        headers=self.headers,
-                        files=files,
-                        data=form_data
-                    )
-                else:
-                    response = client.post(
-                        self.upload_endpoint,
-                        headers=self.headers,
-                        files=files,
-                        data=data
-                    )
-                
-                # Check response status
-                response.raise_for_status()
-                
-                logger.info(
-                    f"Successfully uploaded document to Paperless NGX: {document_path_obj.name}"
+            client = _get_http_client(self.timeout, self.verify_ssl)
+            
+            # Make the upload request. The open file handle is passed to httpx,
+            # which streams it in chunks instead of holding the whole document
+            # in memory; the handle must stay open until post() returns.
+            with open(document_path_obj, "rb") as file:
+                files = {
+                    "document": (document_path_obj.name, file, content_type)
+                }
+                response = client.post(
+                    self.upload_endpoint,
+                    headers=self.headers,
+                    files=files,
+                    data=data
                 )
-                
-                # Paperless NGX typically returns "OK" or a JSON response
-                try:
-                    result = response.json()
-                except json.JSONDecodeError:
-                    # If response is not JSON, return text
-                    result = {"status": "success", "message": response.text}
-                
-                return result
-                
+            
+            # Check response status
+            response.raise_for_status()
+            
+            logger.info(
+                f"Successfully uploaded document to Paperless NGX: {document_path_obj.name}"
+            )
+            
+            # Paperless NGX typically returns "OK" or a JSON response
+            try:
+                result = response.json()
+            except json.JSONDecodeError:
+                # If response is not JSON, return text
+                result = {"status": "success", "message": response.text}
+            
+            return result
+            
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"HTTP error uploading document to Paperless NGX: {e.response.status_code} - {e.response.text}"
@@ -229,21 +248,11 @@ class PaperlessNgxService:
         Returns:
             str: MIME type for the file.
         """
-        extension = file_path.suffix.lower()
-        content_types = {
-            ".pdf": "application/pdf",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".tiff": "image/tiff",
-            ".tif": "image/tiff",
-            ".gif": "image/gif",
-            ".bmp": "image/bmp",
-            ".doc": "application/msword",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".txt": "text/plain",
-        }
-        return content_types.get(extension, "application/octet-stream")
+        content_type = _CONTENT_TYPES.get(file_path.suffix.lower())
+        if content_type is None:
+            # Less common formats: ask the platform MIME database
+            content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        return content_type
     
     def upload_medical_document_from_dict(
         self,
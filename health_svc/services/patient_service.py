@@ -12,6 +12,8 @@ Dependency Injection:
     Use core.dependencies.get_patient_service() in routers with Depends().
 """
 import logging
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Optional
 
 from repositories import PatientRepository
@@ -20,6 +22,22 @@ from core.exceptions import PatientNotFoundError, DuplicatePatientError
 
 logger = logging.getLogger(__name__)
 
+# Repository patient dict -> (id, name, created_at), the _patient_response arguments
+_patient_row = itemgetter("id", "name", "created_at")
+
+
+@lru_cache(maxsize=10_000)
+def _patient_response(patient_id: int, name: str, created_at: str) -> PatientResponse:
+    """
+    Build (or reuse) the response model for a patient row.
+    
+    Patient rows never change once created, so the model for a given
+    (id, name, created_at) can be shared across requests instead of being
+    re-validated on every /patients call. PatientResponse is frozen, so a
+    shared instance cannot be mutated by one caller under another.
+    """
+    return PatientResponse(id=patient_id, name=name, created_at=created_at)
+
 
 class PatientService:
     """
@@ -62,11 +80,31 @@ class PatientService:
             raise DuplicatePatientError(patient_name=name)
         
         logger.info(f"Patient created successfully: {name} (id={created_patient['id']})")
-        return PatientResponse(
-            id=created_patient["id"],
-            name=created_patient["name"],
-            created_at=created_patient["created_at"]
-        )
+        return _patient_response(*_patient_row(created_patient))
+    
+    def add_patients(self, names: List[str]) -> List[PatientResponse]:
+        """
+        Add several patients at once (e.g. bulk enrollment).
+        
+        Unlike add_patient(), existing names are skipped instead of raising
+        DuplicatePatientError, so one duplicate does not abort the batch.
+        
+        Args:
+            names: Patients' full names.
+        
+        Returns:
+            List[PatientResponse]: The patients that were created, in input order.
+        """
+        logger.info(f"Adding {len(names)} patients")
+        
+        created_patients = self._repo.add_many(names)
+        
+        skipped = len(names) - len(created_patients)
+        if skipped:
+            logger.warning(f"Skipped {skipped} existing or repeated patient names")
+        
+        logger.info(f"Created {len(created_patients)} patients")
+        return [_patient_response(*row) for row in map(_patient_row, created_patients)]
     
     def get_patients(self) -> List[PatientResponse]:
         """
@@ -76,14 +114,7 @@ class PatientService:
             List of PatientResponse objects, sorted alphabetically by name.
         """
         patients = self._repo.get_all()
-        return [
-            PatientResponse(
-                id=p["id"],
-                name=p["name"],
-                created_at=p["created_at"]
-            )
-            for p in patients
-        ]
+        return [_patient_response(*row) for row in map(_patient_row, patients)]
     
     def get_patient_by_name(self, name: str) -> PatientResponse:
         """
@@ -98,15 +129,11 @@ class PatientService:
         Raises:
             PatientNotFoundError: If no patient with this name exists.
         """
-        patient = self._repo.get_by_name(name)
+        patient = self.get_patient_by_name_or_none(name)
         if patient is None:
             raise PatientNotFoundError(patient_name=name)
         
-        return PatientResponse(
-            id=patient["id"],
-            name=patient["name"],
-            created_at=patient["created_at"]
-        )
+        return patient
     
     def get_patient_by_name_or_none(self, name: str) -> Optional[PatientResponse]:
         """
@@ -123,9 +150,5 @@ class PatientService:
         """
         patient = self._repo.get_by_name(name)
         if patient:
-            return PatientResponse(
-                id=patient["id"],
-                name=patient["name"],
-                created_at=patient["created_at"]
-            )
+            return _patient_response(*_patient_row(patient))
         return None
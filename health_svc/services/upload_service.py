@@ -5,17 +5,22 @@ This service contains business logic for file upload handling,
 including validation, storage, and background task queuing.
 """
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
-from typing import Tuple, Optional
+from starlette.concurrency import run_in_threadpool
+from typing import BinaryIO, Tuple, Optional
 
 from core.config import UPLOAD_DIR, UPLOAD_MAX_SIZE
 from services.validators.upload_validator import validate_upload_file, validate_file_size
 
 logger = logging.getLogger(__name__)
 
+# Bytes copied per read when streaming an upload to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class UploadService:
     """Service for handling file uploads."""
@@ -33,6 +38,18 @@ class UploadService:
         # Ensure upload directory exists
         self.upload_dir.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def upload_dir(self) -> Path:
+        """Directory where uploaded files are stored."""
+        return self._upload_dir
+    
+    @upload_dir.setter
+    def upload_dir(self, upload_dir: Path) -> None:
+        self._upload_dir = Path(upload_dir)
+        # Per-upload paths are joined onto this string rather than built as
+        # Path objects on every request
+        self._upload_dir_str = str(self._upload_dir)
+    
     async def save_uploaded_file(
         self,
         file: UploadFile,
@@ -43,9 +60,9 @@ class UploadService:
         Save an uploaded file to disk and optionally queue background processing.
         
         This method:
-        1. Validates the uploaded file (type, extension, size)
+        1. Validates the uploaded file (type, extension)
         2. Generates a unique filename
-        3. Saves the file to disk
+        3. Streams the file to disk, validating its size
         4. Optionally queues a Celery task for background processing
         
         Args:
@@ -63,41 +80,42 @@ class UploadService:
         content_type, file_extension = validate_upload_file(file, self.max_size)
         
         try:
-            # Read file content to check size and validate
-            file_content = await file.read()
-            file_size = len(file_content)
-            
-            # Validate file size
-            validate_file_size(file_size, self.max_size)
-            
             # Generate unique filename
-            unique_id = str(uuid.uuid4())
-            unique_filename = f"{unique_id}{file_extension}"
-            upload_path = self.upload_dir / unique_filename
+            unique_filename = f"{uuid.uuid4().hex}{file_extension}"
+            upload_path = os.path.join(self._upload_dir_str, unique_filename)
             
-            # Write file to disk
+            # Stream the upload to disk in a worker thread: memory stays at
+            # one chunk per upload and the event loop is not blocked on disk I/O
             try:
-                with open(upload_path, "wb") as f:
-                    f.write(file_content)
-                logger.info(f"Successfully uploaded file: {unique_filename} (size: {file_size} bytes)")
+                file_size = await run_in_threadpool(self._write_upload, file.file, upload_path)
             except OSError as e:
+                self._remove_partial(upload_path)
                 logger.error(f"Failed to write file to disk: {str(e)}")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to save file to disk"
                 )
             
+            # Validate file size; empty or oversized uploads leave no file behind
+            try:
+                validate_file_size(file_size, self.max_size)
+            except HTTPException:
+                self._remove_partial(upload_path)
+                raise
+            logger.info(f"Successfully uploaded file: {unique_filename} (size: {file_size} bytes)")
+            
             # Queue Celery task for background processing
             task_id = None
             if queue_background_task:
                 try:
-                    # Lazy import to avoid circular dependency
+                    # Lazy import: avoids a circular dependency and keeps Celery out of
+                    # modules that import UploadService but never queue tasks
                     from tasks.upload_tasks import process_uploaded_file
                     
                     upload_timestamp = datetime.now(timezone.utc).isoformat()
                     task = process_uploaded_file.delay(
                         filename=unique_filename,
-                        file_path=str(upload_path),
+                        file_path=upload_path,
                         file_size=file_size,
                         content_type=content_type,
                         upload_timestamp=upload_timestamp,
@@ -113,7 +131,7 @@ class UploadService:
                     )
                     # Continue with response even if task queuing failed
             
-            return unique_filename, str(upload_path), task_id
+            return unique_filename, upload_path, task_id
             
         except HTTPException:
             # Re-raise HTTP exceptions
@@ -124,3 +142,31 @@ class UploadService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred while processing the upload"
             )
+    
+    def _write_upload(self, source: BinaryIO, upload_path: str) -> int:
+        """
+        Copy an upload to disk in chunks, stopping once it exceeds max_size.
+        
+        Args:
+            source: The upload's underlying binary file object.
+            upload_path: Destination path.
+        
+        Returns:
+            int: Bytes read; greater than max_size if the upload was cut short.
+        """
+        file_size = 0
+        with open(upload_path, "wb") as f:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > self.max_size:
+                    break
+                f.write(chunk)
+        return file_size
+    
+    @staticmethod
+    def _remove_partial(upload_path: str) -> None:
+        """Delete a partially written upload, if it exists."""
+        try:
+            os.unlink(upload_path)
+        except FileNotFoundError:
+            pass
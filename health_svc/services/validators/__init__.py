@@ -7,8 +7,10 @@ from services.validators.upload_validator import (
     validate_file_present,
     validate_content_type,
     validate_file_extension,
+    validate_declared_size,
     ALLOWED_IMAGE_TYPES,
     ALLOWED_EXTENSIONS,
+    EXTENSION_CONTENT_TYPES,
 )
 
 __all__ = [
@@ -17,7 +19,9 @@ __all__ = [
     "validate_file_present",
     "validate_content_type",
     "validate_file_extension",
+    "validate_declared_size",
     "ALLOWED_IMAGE_TYPES",
     "ALLOWED_EXTENSIONS",
+    "EXTENSION_CONTENT_TYPES",
 ]
 
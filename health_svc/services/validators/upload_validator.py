@@ -4,7 +4,6 @@ Validation utilities for file uploads.
 This module contains validation logic for file upload operations.
 """
 import logging
-from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
 from typing import Tuple
 
@@ -17,7 +16,26 @@ ALLOWED_IMAGE_TYPES = {
     "image/gif": [".gif"],
     "image/bmp": [".bmp"]
 }
-ALLOWED_EXTENSIONS = {ext for exts in ALLOWED_IMAGE_TYPES.values() for ext in exts}
+# Reverse map: each allowed extension belongs to exactly one content type
+EXTENSION_CONTENT_TYPES = {ext: ct for ct, exts in ALLOWED_IMAGE_TYPES.items() for ext in exts}
+ALLOWED_EXTENSIONS = frozenset(EXTENSION_CONTENT_TYPES)
+
+# Error details, built once
+_ALLOWED_TYPES_DETAIL = f"Invalid file type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES)}"
+_ALLOWED_EXTENSIONS_DETAIL = f"Invalid file extension. Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+
+
+def _file_extension(filename: str) -> str:
+    """
+    Return the lowercased extension of a filename, like ``Path(filename).suffix``.
+
+    Only the last path component is considered and dotfiles such as
+    ``.jpg`` have no extension.
+    """
+    dot = filename.rfind(".")
+    if dot <= 0 or dot == len(filename) - 1 or filename[dot - 1] == "/" or "/" in filename[dot:]:
+        return ""
+    return filename[dot:].lower()
 
 
 def validate_file_present(file: UploadFile) -> None:
@@ -62,7 +80,7 @@ def validate_content_type(file: UploadFile) -> str:
         logger.error(f"Invalid content type: {file.content_type}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES.keys())}"
+            detail=_ALLOWED_TYPES_DETAIL
         )
     
     return file.content_type
@@ -82,18 +100,18 @@ def validate_file_extension(file: UploadFile, content_type: str) -> str:
     Raises:
         HTTPException: 400 Bad Request if extension is missing, invalid, or doesn't match content type.
     """
-    file_extension = Path(file.filename).suffix.lower() if file.filename else ""
+    file_extension = _file_extension(file.filename) if file.filename else ""
     
-    if not file_extension or file_extension not in ALLOWED_EXTENSIONS:
+    extension_content_type = EXTENSION_CONTENT_TYPES.get(file_extension)
+    if extension_content_type is None:
         logger.error(f"Invalid file extension: {file_extension}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file extension. Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            detail=_ALLOWED_EXTENSIONS_DETAIL
         )
     
     # Verify extension matches content type
-    expected_extensions = ALLOWED_IMAGE_TYPES.get(content_type, [])
-    if file_extension not in expected_extensions:
+    if extension_content_type != content_type:
         logger.error(f"File extension {file_extension} does not match content type {content_type}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -129,6 +147,25 @@ def validate_file_size(file_size: int, max_size: int) -> None:
         )
 
 
+def validate_declared_size(file: UploadFile, max_size: int) -> None:
+    """
+    Reject an upload whose known size already exceeds the limit.
+    
+    Starlette records the size of each multipart file part as it is parsed,
+    so oversized uploads can be refused before any bytes are copied to disk.
+    Uploads without a known size are checked after the copy instead.
+    
+    Args:
+        file: The uploaded file object.
+        max_size: Maximum allowed file size in bytes.
+        
+    Raises:
+        HTTPException: 413 Payload Too Large if the known size exceeds max size.
+    """
+    if file.size is not None and file.size > max_size:
+        validate_file_size(file.size, max_size)
+
+
 def validate_upload_file(file: UploadFile, max_size: int) -> Tuple[str, str]:
     """
     Perform all validation checks on an uploaded file.
@@ -137,7 +174,7 @@ def validate_upload_file(file: UploadFile, max_size: int) -> Tuple[str, str]:
     1. File presence
     2. Content type
     3. File extension
-    4. File size (requires file content to be read)
+    4. Declared file size, when known
     
     Args:
         file: The uploaded file object.
@@ -152,9 +189,10 @@ def validate_upload_file(file: UploadFile, max_size: int) -> Tuple[str, str]:
     validate_file_present(file)
     content_type = validate_content_type(file)
     file_extension = validate_file_extension(file, content_type)
+    validate_declared_size(file, max_size)
     
-    # Note: File size validation requires reading the file content,
-    # so it's handled separately in the service layer after reading
+    # Note: The bytes actually received are still size-checked in the
+    # service layer while the file is copied to disk
     
     return content_type, file_extension
 
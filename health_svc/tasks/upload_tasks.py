@@ -54,6 +54,23 @@ MAX_RETRIES = 3
 NON_RETRYABLE_ERRORS = (FileNotFoundError, ValueError, ValidationError, PatientNotFoundError)
 
 
+# Sample date formats, day-first (lab report style) and year-first (ISO)
+_DMY_DATE_FORMATS = (
+    "%d-%m-%Y %I:%M %p",  # 08-11-2025 03:17 PM
+    "%d/%m/%Y %I:%M %p",  # 28/09/2025 03:17 PM
+    "%d-%m-%Y %H:%M %p",  # 28-09-2025 00:00 AM (Gemini sometimes returns this)
+    "%d/%m/%Y %H:%M %p",  # 28/09/2025 00:00 AM
+    "%d-%m-%Y %H:%M",     # 08-11-2025 15:17
+    "%d/%m/%Y %H:%M",     # 28/09/2025 15:17
+    "%d-%m-%Y",           # 08-11-2025
+    "%d/%m/%Y",           # 28/09/2025
+)
+_ISO_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",  # 2025-11-08 15:17:00
+    "%Y-%m-%d",           # 2025-11-08
+)
+
+
 def parse_sample_date(date_str: str) -> datetime:
     """
     Parse sample date string from lab report format to datetime.
@@ -70,18 +87,9 @@ def parse_sample_date(date_str: str) -> datetime:
     Raises:
         ValueError: If date string cannot be parsed.
     """
-    formats = [
-        "%d-%m-%Y %I:%M %p",  # 08-11-2025 03:17 PM
-        "%d/%m/%Y %I:%M %p",  # 28/09/2025 03:17 PM
-        "%d-%m-%Y %H:%M %p",  # 28-09-2025 00:00 AM (Gemini sometimes returns this)
-        "%d/%m/%Y %H:%M %p",  # 28/09/2025 00:00 AM
-        "%d-%m-%Y %H:%M",     # 08-11-2025 15:17
-        "%d/%m/%Y %H:%M",     # 28/09/2025 15:17
-        "%d-%m-%Y",           # 08-11-2025
-        "%d/%m/%Y",           # 28/09/2025
-        "%Y-%m-%d %H:%M:%S",  # 2025-11-08 15:17:00
-        "%Y-%m-%d"            # 2025-11-08
-    ]
+    # Only year-first strings can match the ISO formats and vice versa,
+    # so try just the relevant group instead of failing through all of them
+    formats = _ISO_DATE_FORMATS if date_str[:4].isdigit() else _DMY_DATE_FORMATS
     
     for fmt in formats:
         try:
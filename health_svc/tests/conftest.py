@@ -47,6 +47,7 @@ def temp_db():
     yield db
     
     # Cleanup
+    db.close()
     if os.path.exists(db_path):
         os.unlink(db_path)
 
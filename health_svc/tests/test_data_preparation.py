@@ -0,0 +1,158 @@
+"""
+Unit tests for DataPreparationService.
+
+Tests cover:
+- Chronological ordering of prepared data points
+- Skipping records with invalid timestamps or values
+- Date range calculation across metrics
+- LTTB downsampling of long series (metrics and blood pressure)
+
+These tests avoid Plotly imports and filesystem access.
+"""
+from datetime import datetime, timezone
+
+from models import HealthRecord
+from schemas import HealthRecordResponse
+from services.graph.data_preparation_service import (
+    BloodPressureDataPoint,
+    DataPreparationService,
+    PreparedBloodPressureData,
+    lttb_indices,
+)
+
+
+def _record(timestamp: str, record_type: str, value: str) -> HealthRecordResponse:
+    """Build a HealthRecordResponse with test defaults."""
+    return HealthRecordResponse(
+        timestamp=timestamp,
+        patient="Test Patient",
+        record_type=record_type,
+        value=value,
+        unit="mg/dl",
+    )
+
+
+class TestPrepareDataset:
+    """Tests for DataPreparationService.prepare_dataset."""
+
+    def test_data_points_sorted_by_parsed_timestamp(self):
+        """Points should be ordered by datetime, not by timestamp string."""
+        records = [
+            _record("2025-01-01T22:00:00+00:00", "creatinine", "1.1"),
+            _record("2025-01-02T01:00:00+05:00", "creatinine", "1.3"),  # 2025-01-01T20:00Z
+            _record("2025-01-01T10:00:00+00:00", "creatinine", "0.9"),
+        ]
+
+        dataset = DataPreparationService().prepare_dataset(records)
+
+        assert dataset.metrics["creatinine"].values == [0.9, 1.3, 1.1]
+
+    def test_invalid_records_skipped(self):
+        """Records with bad timestamps or values should be dropped."""
+        records = [
+            _record("not-a-date", "creatinine", "1.0"),
+            _record("2025-01-01T10:00:00+00:00", "creatinine", "abc"),
+            _record("2025-01-02T10:00:00+00:00", "creatinine", "1.1"),
+        ]
+
+        dataset = DataPreparationService().prepare_dataset(records)
+
+        assert dataset.metrics["creatinine"].values == [1.1]
+
+    def test_date_range_spans_all_metrics(self):
+        """Date range should cover the earliest and latest point of any metric."""
+        records = [
+            _record("2025-01-05T10:00:00+00:00", "creatinine", "1.0"),
+            _record("2025-01-01T10:00:00+00:00", "sodium", "140"),
+            _record("2025-01-09T10:00:00+00:00", "sodium", "138"),
+        ]
+
+        dataset = DataPreparationService().prepare_dataset(records)
+
+        assert dataset.date_range == (
+            datetime(2025, 1, 1, 10, tzinfo=timezone.utc),
+            datetime(2025, 1, 9, 10, tzinfo=timezone.utc),
+        )
+
+    def test_domain_records_match_responses(self):
+        """HealthRecord objects with datetime timestamps prepare identically."""
+        responses = [
+            _record("2025-01-02T10:00:00+00:00", "creatinine", "1.3"),
+            _record("2025-01-01T10:00:00+00:00", "creatinine", "1.1"),
+        ]
+        domain_records = [
+            HealthRecord(
+                timestamp=datetime.fromisoformat(r.timestamp),
+                patient=r.patient,
+                record_type=r.record_type,
+                value=r.value,
+                unit=r.unit,
+            )
+            for r in responses
+        ]
+
+        service = DataPreparationService()
+
+        assert service.prepare_dataset(domain_records) == service.prepare_dataset(responses)
+
+    def test_summaries_ordered_by_clinical_priority(self):
+        """Priority metrics (including aliases) come first, the rest alphabetically."""
+        records = [
+            _record("2025-01-01T10:00:00+00:00", "zinc", "90"),
+            _record("2025-01-01T10:00:00+00:00", "sodium", "140"),
+            _record("2025-01-01T10:00:00+00:00", "albumin", "4.0"),
+            _record("2025-01-01T10:00:00+00:00", "serum creatinine", "1.0"),
+        ]
+
+        dataset = DataPreparationService().prepare_dataset(records)
+
+        assert [s.metric_name for s in dataset.summaries] == [
+            "serum creatinine", "sodium", "albumin", "zinc",
+        ]
+
+
+class TestLttbIndices:
+    """Tests for lttb_indices downsampling."""
+
+    def test_short_series_unchanged(self):
+        """Series at or below the threshold should keep every index."""
+        assert lttb_indices([0, 1, 2], [5, 6, 7], 3) == [0, 1, 2]
+        assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+
+    def test_output_size_and_endpoints(self):
+        """Downsampled output should keep first/last and honor the threshold."""
+        xs = list(range(1000))
+        ys = [float(i % 17) for i in xs]
+
+        indices = lttb_indices(xs, ys, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert indices == sorted(set(indices))
+
+    def test_preserves_spike(self):
+        """A single outlier should survive downsampling."""
+        xs = list(range(1000))
+        ys = [1.0] * 1000
+        ys[537] = 100.0
+
+        assert 537 in lttb_indices(xs, ys, 20)
+
+    def test_blood_pressure_downsampling_keeps_pairs(self):
+        """Downsampled BP readings should keep systolic peaks with their diastolic."""
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+        points = [
+            BloodPressureDataPoint(
+                timestamp=datetime.fromtimestamp(start + i * 3600, tz=timezone.utc),
+                systolic=190.0 if i == 412 else 120.0,
+                diastolic=80.0 + i % 5,
+            )
+            for i in range(1000)
+        ]
+
+        kept = PreparedBloodPressureData(data_points=points).downsampled(50)
+
+        assert len(kept) == 50
+        assert points[412] in kept
+        assert all(points[int((dp.timestamp.timestamp() - start) // 3600)] is dp for dp in kept)
@@ -0,0 +1,52 @@
+"""
+Tests for the Database connection manager.
+
+Tests cover:
+- One reused connection per thread
+- Closing connections left behind by finished threads
+- Releasing every connection on close()
+"""
+import sqlite3
+import threading
+
+import pytest
+
+
+def _connect_in_thread(db):
+    """Return the connection get_connection() gives a new, finished thread."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(db.get_connection()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_connection_reused_per_thread(temp_db):
+    """Test that a thread gets the same connection on repeat calls and other threads get their own."""
+    conn = temp_db.get_connection()
+    assert temp_db.get_connection() is conn
+    assert _connect_in_thread(temp_db) is not conn
+
+
+def test_finished_thread_connection_closed(temp_db):
+    """Test that a finished thread's connection is closed once another thread connects."""
+    stale = _connect_in_thread(temp_db)
+    stale.execute("SELECT 1")
+    
+    _connect_in_thread(temp_db)
+    
+    with pytest.raises(sqlite3.ProgrammingError):
+        stale.execute("SELECT 1")
+
+
+def test_close_releases_connections(temp_db):
+    """Test that close() closes every open connection and later calls reconnect."""
+    conn = temp_db.get_connection()
+    
+    temp_db.close()
+    
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    reopened = temp_db.get_connection()
+    assert reopened is not conn
+    assert reopened.execute("SELECT 1").fetchone() == (1,)
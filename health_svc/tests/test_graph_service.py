@@ -0,0 +1,159 @@
+"""
+Unit tests for GraphService.
+
+Tests cover:
+- Reuse of cached HTML for unchanged records
+- Expiry of cached HTML after the TTL
+- Pre-rendered empty-graph page
+- Plain-dict figure layout
+- Hover over metrics recorded together
+"""
+from schemas import HealthRecordResponse
+from services.graph import GraphService
+from services.graph.data_preparation_service import DataPreparationService
+from services.graph import graph_service as graph_module
+
+
+class _CountingDataPreparationService(DataPreparationService):
+    """DataPreparationService that counts prepare_dataset calls."""
+
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = 0
+
+    def prepare_dataset(self, records):
+        self.calls += 1
+        return super().prepare_dataset(records)
+
+
+def _records(patient: str):
+    """Build enough records to render an interactive graph."""
+    return [
+        HealthRecordResponse(
+            timestamp=f"2025-01-0{day}T10:00:00",
+            patient=patient,
+            record_type="Creatinine",
+            value="1.2",
+            unit="mg/dL",
+        )
+        for day in (1, 2, 3)
+    ]
+
+
+class TestHtmlCache:
+    """Tests for the rendered HTML cache."""
+
+    def test_unchanged_records_served_from_cache(self):
+        """Repeat renders of the same records should return the cached page."""
+        data_prep = _CountingDataPreparationService()
+        service = GraphService(data_preparation_service=data_prep)
+        records = _records("Cache Patient")
+
+        first = service.generate_html_graph(records, "Cache Patient")
+
+        assert service.generate_html_graph(list(records), "Cache Patient") == first
+        assert data_prep.calls == 1
+
+    def test_expired_entry_rebuilt(self, monkeypatch):
+        """Entries older than the TTL should be rendered again."""
+        monkeypatch.setattr(graph_module, "HTML_CACHE_TTL_SECONDS", 0)
+        data_prep = _CountingDataPreparationService()
+        service = GraphService(data_preparation_service=data_prep)
+        records = _records("TTL Patient")
+
+        first = service.generate_html_graph(records, "TTL Patient")
+        second = service.generate_html_graph(records, "TTL Patient")
+
+        assert second == first
+        assert data_prep.calls == 2
+
+
+class TestEmptyGraph:
+    """Tests for the pre-rendered empty-graph page."""
+
+    def test_matches_direct_render(self):
+        """Substituting the name should match rendering the figure directly."""
+        service = GraphService()
+        patient_name = 'O"Brien </script> \\ Jr'
+
+        fig = service._builder.create_figure()
+        service._builder.apply_empty_layout(fig, patient_name)
+
+        assert service.generate_html_graph([], patient_name) == service._render_html(fig)
+
+    def test_template_reused_across_patients(self):
+        """Each patient should get their own name in the shared template."""
+        service = GraphService()
+
+        first = service.generate_html_graph([], "First Patient")
+        second = service.generate_html_graph([], "Second Patient")
+
+        assert "First Patient" in first and "First Patient" not in second
+        assert "Second Patient" in second
+
+
+class TestFigureLayout:
+    """Tests for the plain-dict figure built for the interactive graph."""
+
+    def test_traces_and_layout(self):
+        """Traces should be WebGL scatters with the expanded template applied."""
+        service = GraphService()
+        fig = service._build_figure(_records("Test Patient"), "Test Patient")
+
+        assert all(trace["type"] == "scattergl" for trace in fig["data"])
+        assert all(trace["yaxis"] in ("y", "y2") for trace in fig["data"])
+        layout = fig["layout"]
+        assert layout["template"]["layout"]["plot_bgcolor"] == "white"
+        assert layout["hoverlabel"]["font"] == {"size": 12}
+
+    def test_layout_not_shared_between_figures(self):
+        """Mutating one figure's layout should not leak into the next."""
+        service = GraphService()
+        first = service._build_figure(_records("First"), "First")
+        first["layout"]["xaxis"]["gridcolor"] = "red"
+        first["layout"]["template"]["layout"]["plot_bgcolor"] = "black"
+
+        second = service._build_figure(_records("Second"), "Second")
+
+        assert second["layout"]["xaxis"]["gridcolor"] != "red"
+        assert second["layout"]["template"]["layout"]["plot_bgcolor"] == "white"
+
+
+class TestPanelHover:
+    """Tests for metrics recorded under one timestamp (e.g. a lipid panel)."""
+
+    PANEL = {"Cholesterol": "190", "Triglycerides": "140", "HDL": "55", "LDL": "110"}
+
+    def _panel_records(self):
+        return [
+            HealthRecordResponse(
+                timestamp=f"2025-01-0{day}T10:00:00",
+                patient="Panel Patient",
+                record_type=record_type,
+                value=value,
+                unit="mg/dL",
+            )
+            for day in (1, 2, 3)
+            for record_type, value in self.PANEL.items()
+        ]
+
+    def test_every_metric_reachable_from_unified_hover(self):
+        """Each metric at a shared timestamp should be its own hoverable point."""
+        service = GraphService()
+        fig = service._build_figure(self._panel_records(), "Panel Patient")
+        assert fig["layout"]["hovermode"] == "x unified"
+
+        traces = {trace["name"]: trace for trace in fig["data"]}
+        for record_type, value in self.PANEL.items():
+            trace = traces[record_type.title()]
+            # A unified hover shows one point per trace at the hovered x
+            hovered = [
+                y for x, y in zip(trace["x"], trace["y"])
+                if x.isoformat().startswith("2025-01-02")
+            ]
+            assert hovered == [float(value)]
+            assert f"<b>{record_type.title()}</b>" in trace["hovertemplate"]
+
+        groups = {traces[name.title()]["legendgroup"] for name in self.PANEL}
+        assert len(groups) == 1
@@ -28,6 +28,7 @@ from core.metric_registry import (
     _normalize_metric_name,
     parse_metric_value,
     calculate_trend,
+    format_metric_value,
     MetricConfig,
     get_metric,
     get_metric_config,
@@ -158,6 +159,11 @@ class TestParseMetricValue:
         assert parse_metric_value("0.5") == 0.5
         assert parse_metric_value("100.25") == 100.25
     
+    def test_numeric_with_surrounding_whitespace(self):
+        """Should parse numbers padded with whitespace."""
+        assert parse_metric_value("  1.2 ") == 1.2
+        assert parse_metric_value("\t140\n") == 140.0
+    
     def test_none_input(self):
         """Should return None for None input."""
         assert parse_metric_value(None) is None
@@ -323,6 +329,20 @@ class TestCalculateTrend:
         assert calculate_trend([-100.0, -110.0]) == "↓"  # Decreasing (more negative)
 
 
+# =============================================================================
+# TESTS: format_metric_value
+# =============================================================================
+
+class TestFormatMetricValue:
+    """Tests for format_metric_value."""
+    
+    def test_precision_by_magnitude(self):
+        """Should use fewer decimals for larger values."""
+        assert format_metric_value(123.456) == "123"
+        assert format_metric_value(12.345) == "12.3"
+        assert format_metric_value(1.2345) == "1.23"
+
+
 # =============================================================================
 # TESTS: MetricConfig.is_abnormal
 # =============================================================================
@@ -654,6 +674,12 @@ class TestGetMetric:
         with pytest.raises(KeyError) as exc_info:
             get_metric("unknown_metric_xyz")
         assert "unknown_metric_xyz" in str(exc_info.value)
+    
+    def test_names_pre_normalized(self):
+        """Definitions should carry their lookup keys, normalized once at load."""
+        metric = get_metric("creatinine")
+        assert metric.normalized_canonical == "creatinine"
+        assert metric.normalized_aliases == tuple(_normalize_metric_name(a) for a in metric.aliases)
 
 
 class TestGetMetricConfig:
@@ -1,6 +1,10 @@
 """
 Tests for patient endpoints.
 """
+import pytest
+from pydantic import ValidationError
+
+
 # Patient Endpoint Tests
 def test_create_patient_success(client):
     """Test successful patient creation."""
@@ -74,3 +78,67 @@ def test_get_patients_multiple(client):
     assert patients[1]["name"] == "Bob Patient"
     assert patients[2]["name"] == "Zebra Patient"
 
+
+
+def test_patient_lookups_use_shared_cache(temp_db, patient_repo, monkeypatch):
+    """Test that patient lookups are cached on the database across repositories."""
+    from repositories import PatientRepository
+    
+    created = patient_repo.add("Cached Patient")
+    assert patient_repo.get_id_by_name("Missing Patient") is None
+    
+    def fail_connection():
+        raise AssertionError("lookup should be served from cache")
+    
+    monkeypatch.setattr(temp_db, "get_connection", fail_connection)
+    assert PatientRepository(db=temp_db).get_id_by_name("Cached Patient") == created["id"]
+    assert PatientRepository(db=temp_db).get_by_name("Cached Patient") == created
+
+
+def test_get_all_cached_until_patient_added(temp_db, patient_repo, monkeypatch):
+    """Test that the patient list is cached and refreshed after an insert."""
+    patient_repo.add("First Patient")
+    assert [p["name"] for p in patient_repo.get_all()] == ["First Patient"]
+    
+    def fail_connection():
+        raise AssertionError("list should be served from cache")
+    
+    real_connection = temp_db.get_connection
+    monkeypatch.setattr(temp_db, "get_connection", fail_connection)
+    assert [p["name"] for p in patient_repo.get_all()] == ["First Patient"]
+    
+    monkeypatch.setattr(temp_db, "get_connection", real_connection)
+    patient_repo.add("Second Patient")
+    assert [p["name"] for p in patient_repo.get_all()] == ["First Patient", "Second Patient"]
+
+
+def test_add_patients_skips_existing_names(patient_repo, patient_service):
+    """Test that bulk add creates new patients and skips duplicates."""
+    patient_service.add_patient("Existing Patient")
+    assert [p.name for p in patient_service.get_patients()] == ["Existing Patient"]
+    
+    created = patient_service.add_patients(["New One", "Existing Patient", "New Two", "New One"])
+    
+    assert [p.name for p in created] == ["New One", "New Two"]
+    assert patient_repo.get_by_name("New Two")["id"] == created[1].id
+    assert [p.name for p in patient_service.get_patients()] == [
+        "Existing Patient", "New One", "New Two",
+    ]
+
+
+def test_failed_add_leaves_no_open_transaction(temp_db, patient_repo):
+    """Test that a rejected duplicate insert does not leave the shared connection in a transaction."""
+    patient_repo.add("Same Name")
+    assert patient_repo.add("Same Name") is None
+    assert not temp_db.get_connection().in_transaction
+
+
+def test_patient_responses_shared_and_frozen(patient_service):
+    """Test that unchanged patient rows reuse one response model that cannot be mutated."""
+    created = patient_service.add_patient("Frozen Patient")
+    fetched = patient_service.get_patient_by_name("Frozen Patient")
+    assert fetched is created
+    
+    with pytest.raises(ValidationError):
+        fetched.name = "Renamed"
+    assert patient_service.get_patient_by_name("Frozen Patient").name == "Frozen Patient"
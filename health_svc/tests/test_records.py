@@ -356,6 +356,81 @@ def test_get_html_view_success(client):
     assert "Graph Patient" in html_content
 
 
+def test_get_html_view_few_records_returns_table(client):
+    """Test that very small record sets render as a static table without Plotly."""
+    client.post("/api/v1/patients", json={"name": "Table Patient"})
+    client.post("/api/v1/records", json={
+        "timestamp": "2025-01-01T10:00:00",
+        "patient": "Table Patient",
+        "record_type": "Creatinine",
+        "value": "1.2",
+        "unit": "mg/dL"
+    })
+    
+    response = client.get("/api/v1/records/html-view?patient_name=Table Patient")
+    assert response.status_code == 200
+    
+    html_content = response.text
+    assert "<table" in html_content
+    assert "Table Patient" in html_content
+    assert "1.2 mg/dL" in html_content
+    assert "cdn.plot.ly" not in html_content
+
+
+def test_get_html_view_rerenders_after_new_record(client):
+    """Test that cached HTML is reused until the patient's records change."""
+    client.post("/api/v1/patients", json={"name": "Cache Patient"})
+    for day, value in (("01", "1.2"), ("02", "1.4")):
+        client.post("/api/v1/records", json={
+            "timestamp": f"2025-01-{day}T10:00:00",
+            "patient": "Cache Patient",
+            "record_type": "Creatinine",
+            "value": value,
+            "unit": "mg/dL"
+        })
+    
+    first = client.get("/api/v1/records/html-view?patient_name=Cache Patient").text
+    again = client.get("/api/v1/records/html-view?patient_name=Cache Patient").text
+    assert again == first
+    
+    client.post("/api/v1/records", json={
+        "timestamp": "2025-01-03T10:00:00",
+        "patient": "Cache Patient",
+        "record_type": "Creatinine",
+        "value": "1.9",
+        "unit": "mg/dL"
+    })
+    updated = client.get("/api/v1/records/html-view?patient_name=Cache Patient").text
+    assert updated != first
+    assert "1.9" in updated
+
+
+def test_get_html_view_build_failure_returns_500(test_app, monkeypatch):
+    """Test that a failure while building the graph is a 500, not a cut-off page."""
+    from fastapi.testclient import TestClient
+    from services.graph import GraphService
+    
+    client = TestClient(test_app, raise_server_exceptions=False)
+    client.post("/api/v1/patients", json={"name": "Broken Graph"})
+    for day in (1, 2, 3):
+        client.post("/api/v1/records", json={
+            "timestamp": f"2025-01-0{day}T10:00:00",
+            "patient": "Broken Graph",
+            "record_type": "Creatinine",
+            "value": "1.2",
+            "unit": "mg/dL"
+        })
+    
+    def fail_build(self, records, patient_name):
+        raise RuntimeError("figure build failed")
+    
+    monkeypatch.setattr(GraphService, "_build_figure", fail_build)
+    monkeypatch.setattr(GraphService, "_get_cached_html", lambda self, key: None)
+    
+    response = client.get("/api/v1/records/html-view?patient_name=Broken Graph")
+    assert response.status_code == 500
+
+
 def test_get_html_view_no_records(client):
     """Test getting HTML graph view for a patient with no records."""
     # Create patient
@@ -372,8 +447,92 @@ def test_get_html_view_no_records(client):
     assert "Empty Patient" in html_content
 
 
+def test_get_graph_data_returns_figure_json(client):
+    """Test getting the graph figure as JSON."""
+    client.post("/api/v1/patients", json={"name": "Json Patient"})
+    client.post("/api/v1/records", json={
+        "timestamp": "2025-01-01T10:00:00",
+        "patient": "Json Patient",
+        "record_type": "Creatinine",
+        "value": "1.2",
+        "unit": "mg/dL"
+    })
+    
+    response = client.get("/api/v1/records/graph-data?patient_name=Json Patient")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    
+    figure = response.json()
+    assert set(figure) == {"data", "layout", "config"}
+    assert figure["data"][0]["y"] == [1.2]
+    assert "Json Patient" in figure["layout"]["title"]["text"]
+
+
+def test_get_graph_data_builds_off_event_loop(client, monkeypatch):
+    """Test that graph-data loads records and builds the figure in a worker thread."""
+    import asyncio
+    from services import HealthService
+    from services.graph import GraphService
+    
+    on_loop = []
+    
+    def track(method):
+        def wrapper(self, *args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(method.__name__)
+            except RuntimeError:
+                pass
+            return method(self, *args, **kwargs)
+        return wrapper
+    
+    monkeypatch.setattr(HealthService, "get_graph_records", track(HealthService.get_graph_records))
+    monkeypatch.setattr(GraphService, "generate_graph_json", track(GraphService.generate_graph_json))
+    
+    client.post("/api/v1/patients", json={"name": "Worker Patient"})
+    response = client.get("/api/v1/records/graph-data?patient_name=Worker Patient")
+    assert response.status_code == 200
+    assert on_loop == []
+
+
 def test_get_html_view_missing_patient_name(client):
     """Test getting HTML view without patient_name parameter."""
     response = client.get("/api/v1/records/html-view")
     assert response.status_code == 422  # Validation error
 
+
+
+def test_save_batch_returns_inserted_ids(patient_repo, record_repo):
+    """Test that a lab report batch returns the IDs of the rows it inserted."""
+    from datetime import datetime, timezone
+    
+    patient_id = patient_repo.add("Batch Patient")["id"]
+    timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    first_id = record_repo.save(timestamp, patient_id, "Weight", "70", "kg")
+    
+    record_ids = record_repo.save_batch(
+        patient_id=patient_id,
+        timestamp=timestamp,
+        lab_name="City Lab",
+        test_results=[
+            {"test_name": "Sodium", "results": "140", "unit": "mmol/L"},
+            {"test_name": "Potassium", "results": "4.1", "unit": "mmol/L"},
+        ],
+    )
+    
+    assert record_ids == [first_id + 1, first_id + 2]
+    assert record_repo.save_batch(patient_id, timestamp, "City Lab", []) == []
+    rows = record_repo.get_all_rows("Batch Patient")
+    assert sorted(r[2] for r in rows) == ["Potassium", "Sodium", "Weight"]
+
+
+def test_record_queries_use_timestamp_indexes(temp_db, record_repo):
+    """Test that record listing walks an index instead of sorting the table."""
+    conn = temp_db.get_connection()
+    
+    # The exact statements _select() runs, filtered by patient and unfiltered
+    for patient_name in ("x", None):
+        sql, params = record_repo._build_select(patient_name, None, 100)
+        plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        assert "TEMP B-TREE" not in plan
+        assert "idx_health_records_" in plan
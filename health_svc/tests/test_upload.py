@@ -337,6 +337,19 @@ def test_upload_invalid_extension(client):
     assert "extension" in response.json()["detail"].lower()
 
 
+def test_upload_dotfile_has_no_extension(client):
+    """Test upload of a bare dotfile name like '.jpg' returns 400."""
+    image_data = create_test_image("jpeg", 1024)
+    image_data.seek(0)
+    
+    response = client.post(
+        "/api/v1/records/upload",
+        files={"file": (".jpg", image_data, "image/jpeg")}
+    )
+    assert response.status_code == 400
+    assert "extension" in response.json()["detail"].lower()
+
+
 def test_upload_extension_mismatch(client):
     """Test upload where extension doesn't match content type returns 400."""
     image_data = create_test_image("jpeg", 1024)
@@ -357,12 +370,15 @@ def test_upload_file_too_large(client, temp_upload_dir):
     large_data = BytesIO(b'\xFF\xD8\xFF\xE0' + b'\x00' * (large_size - 4))
     large_data.seek(0)
     
-    response = client.post(
-        "/api/v1/records/upload",
-        files={"file": ("large.jpg", large_data, "image/jpeg")}
-    )
+    # Rejected from the declared part size, before anything is copied to disk
+    with patch.object(UploadService, '_write_upload', side_effect=AssertionError("file was copied")):
+        response = client.post(
+            "/api/v1/records/upload",
+            files={"file": ("large.jpg", large_data, "image/jpeg")}
+        )
     assert response.status_code == 413
     assert "size" in response.json()["detail"].lower()
+    assert os.listdir(temp_upload_dir[0]) == []
 
 
 def test_upload_file_at_max_size(client, temp_upload_dir):
@@ -128,6 +128,12 @@ class TestParseSampleDate:
         assert result.month == 9
         assert result.year == 2025
     
+    def test_parse_iso_and_short_day_first_dates(self):
+        """Test year-first dates and day-first dates with single-digit parts."""
+        assert parse_sample_date("2025-11-08 15:17:00") == datetime(2025, 11, 8, 15, 17)
+        assert parse_sample_date("2025-11-08") == datetime(2025, 11, 8)
+        assert parse_sample_date("08-1-2025") == datetime(2025, 1, 8)
+    
     def test_parse_invalid_date_format(self):
         """Test parsing an invalid date format raises ValueError."""
         with pytest.raises(ValueError, match="Failed to parse sample date"):